@@ -7,6 +7,10 @@ from .config  import option
 from .client  import Client
 from .server  import Server
 from .model   import Model
+from .model   import Deferred
+from .model   import Probe
+from .model   import Follower
 from .node    import Node
+from .node    import Snapshot
 from .node    import tree
 from .node    import inspect
@@ -4,18 +4,24 @@ from __future__ import annotations
 
 from .       import discovery
 from .model  import Model
+from .model  import memory
 from .config import option
 
 import jpype
 import jpype.imports                      # ruff: ignore[unused-import]
 
 import os
+import atexit
 import faulthandler
+from hashlib import sha256
+from shutil  import copyfile, rmtree
+from tempfile import mkdtemp
 from pathlib import Path
 from logging import getLogger
 
-from typing          import overload
+from typing          import overload, Literal
 from collections.abc import Iterator
+from collections     import OrderedDict
 from jpype           import JClass
 
 
@@ -243,6 +249,9 @@ class Client:
         self.port       = None
         self.host       = None
         self.java       = java
+        self.pool       = ModelPool()
+        self.registry   = Registry()
+        self.products: dict[str, bool] = {}
 
         # Try to connect to server if not a stand-alone client.
         if not standalone and host and port is not None:
@@ -258,21 +267,77 @@ class Client:
         return f'{self.__class__.__name__}({connection})'
 
     def __contains__(self, item: str | Model) -> bool:
-        if isinstance(item, str) and item in self.names():
-            return True
-        if isinstance(item, Model) and item in self.models():
-            return True
+        if isinstance(item, str):
+            return (self.registry.find(self.java, item) is not None)
+        if isinstance(item, Model):
+            try:
+                tag = str(item.java.tag())
+            except Exception:
+                return False
+            return (tag in self.registry.sync(self.java))
         return False
 
     def __iter__(self) -> Iterator[Model]:
         yield from self.models()
 
+    # Evicts the least recently used models from memory while the pool
+    # exceeds its limits, see `limit()`. The most recently used model is
+    # always kept. Models that Comsol no longer holds are simply dropped.
+    def evict(self):
+        pool = self.pool
+        if pool.count is None and pool.budget is None:
+            return
+        tags = self.registry.sync(self.java)
+        for tag in list(pool.models):
+            if tag not in tags:
+                pool.discard(tag)
+        while len(pool.models) > 1:
+            excess = (pool.count is not None and len(pool.models) > pool.count)
+            over = (pool.budget is not None and pool.bytes() > pool.budget)
+            if not (excess or over):
+                break
+            candidates = list(pool.models)[:-1]
+            if not excess and pool.eviction == 'clear':
+                solved = [tag for tag in candidates
+                          if pool.models[tag].footprint]
+                if solved:
+                    model = pool.models[solved[0]]
+                    log.info(f'Clearing model "{model.name()}" from memory.')
+                    model.clear()
+                    pool.evicted += 1
+                    continue
+            model = pool.models[candidates[0]]
+            log.info(f'Removing model "{model.name()}" from memory.')
+            pool.discard(candidates[0])
+            self.registry.discard(candidates[0])
+            self.java.remove(candidates[0])
+            pool.evicted += 1
+
+    # Marks the model with the given tag as the most recently used one, then
+    # evicts others if the pool exceeds its limits. This is called when a
+    # pooled model has been solved, as that adds to its footprint.
+    def use(self, tag: str):
+        self.pool.touch(tag)
+        self.evict()
+
+    # Checks if the product with the given vendor string is licensed, and
+    # remembers the answer for the rest of the session, as license checks
+    # may be slow. Failed checks are not remembered, as the license server
+    # may just have been unreachable for a moment.
+    def licensed(self, key: str) -> bool:
+        if key not in self.products:
+            try:
+                answer = bool(self.java.hasProduct(key))
+            except Exception as error:
+                log.warning(f'Could not check license for "{key}": {error}')
+                return False
+            self.products[key] = answer
+        return self.products[key]
+
     def __truediv__(self, name: str) -> Model:
         if isinstance(name, str):
-            for model in self:
-                if name == model.name():
-                    break
-            else:
+            model = self.registry.find(self.java, name)
+            if model is None:
                 error = f'Model "{name}" has not been loaded by client.'
                 log.error(error)
                 raise ValueError(error)
@@ -291,8 +356,14 @@ class Client:
         return cores
 
     def models(self) -> list[Model]:
-        """Returns all models currently held in memory."""
-        return [Model(self.java.model(tag)) for tag in self.java.tags()]
+        """
+        Returns all models currently held in memory.
+
+        Each model is represented by the same [`Model`](#Model) instance every
+        time, so that its caches persist.
+        """
+        return [self.registry.wrap(self.java, tag)
+                for tag in self.registry.sync(self.java)]
 
     def names(self) -> list[str]:
         """Returns the names of all loaded models."""
@@ -302,16 +373,53 @@ class Client:
         """Returns the file-system paths of all loaded models."""
         return [model.file() for model in self.models()]
 
-    def modules(self) -> list[str]:
-        """Returns the names of available licensed modules/products."""
-        names = []
-        for (key, value) in modules.items():
-            try:
-                if self.java.hasProduct(key):
-                    names.append(value)
-            except Exception:
-                pass
-        return names
+    def footprints(self) -> dict[str, int]:
+        """
+        Returns the estimated memory footprints of the pooled models.
+
+        Maps the names of the models loaded from files, in the order they
+        were last used, to the estimated number of bytes they occupy. See
+        [`limit()`](#limit) for how these estimates come about.
+        """
+        return {model.name(): self.pool.footprint(tag)
+                for (tag, model) in self.pool.models.items()}
+
+    def modules(self, refresh: bool = False) -> list[str]:
+        """
+        Returns the names of available licensed modules/products.
+
+        Each product requires a license check, which may involve a round trip
+        to the server and then to the license server. So the results are
+        remembered for the rest of the session, or until the client connects
+        to a different server. Pass `refresh=True` to check again.
+        """
+        if refresh:
+            self.products.clear()
+        return [value for (key, value) in modules.items()
+                if self.licensed(key)]
+
+    def has(self, module: str, refresh: bool = False) -> bool:
+        """
+        Checks if the given module/product is available and licensed.
+
+        The `module` is either one of the names returned by
+        [`modules()`](#modules), such as `'Heat Transfer'`, or the vendor
+        string that Comsol uses internally, such as `'HEATTRANSFER'`. Only
+        that one product is checked, and the result remembered just the same.
+        Raises `ValueError` if the module is unknown.
+        """
+        if module in modules:
+            keys = [module]
+        else:
+            keys = [key for (key, value) in modules.items() if value == module]
+        if not keys:
+            error = f'Module "{module}" is unknown.'
+            log.error(error)
+            raise ValueError(error)
+        if refresh:
+            for key in keys:
+                self.products.pop(key, None)
+        return any(self.licensed(key) for key in keys)
 
     ###############
     # Interaction #
@@ -320,13 +428,44 @@ class Client:
     def load(self, file: Path | str) -> Model:
         """Loads a model from the given `file` and returns it."""
         file = Path(file).resolve()
-        if self.caching() and file in self.files():
-            log.info(f'Retrieving "{file.name}" from cache.')
-            return self.models()[self.files().index(file)]
-        tag = self.java.uniquetag('model')
+        caching = self.caching()
+        if caching and not file.is_file():
+            error = f'File "{file}" does not exist.'
+            log.error(error)
+            raise FileNotFoundError(error)
+        signature = None
+        if file.is_file():
+            signature = stamp(file, caching and option('checksum'))
+        entry = self.pool.files.get(file) if caching else None
+        if entry and signature:
+            (tag, previous) = entry
+            model = self.pool.models[tag]
+            if model.saved == (file, *signature[:2]):
+                log.debug(f'File "{file.name}" was saved from memory.')
+                unchanged = True
+            elif previous[2] is None or signature[2] is None:
+                unchanged = (signature[:2] == previous[:2])
+            else:
+                unchanged = (signature == previous)
+            if not unchanged:
+                log.info(f'File "{file.name}" changed since it was loaded.')
+            elif tag not in [str(other) for other in self.java.tags()]:
+                log.debug(f'Model "{tag}" no longer exists in the session.')
+                self.pool.discard(tag)
+            else:
+                log.info(f'Retrieving "{file.name}" from cache.')
+                self.pool.files[file] = (tag, signature)
+                self.pool.touch(tag)
+                return model
+        tag = str(self.java.uniquetag('model'))
         log.info(f'Loading model "{file.name}".')
+        before = memory()
         model = Model(self.java.load(tag, str(file)))
+        self.registry.add(tag, model)
+        self.pool.add(tag, model, max(memory() - before, 0), file, signature)
+        model.state.solved = lambda: self.use(tag)
         log.info('Finished loading model.')
+        self.evict()
         return model
 
     @overload
@@ -342,6 +481,15 @@ class Client:
         if so, return the in-memory model object instead of reloading it from
         disk. By default (at start-up) caching is disabled.
 
+        The check requires no round trip to Comsol. The client keeps an index
+        of the files it loaded, along with their modification time and size,
+        and loads a fresh copy of a file if either has changed since, unless
+        the model itself was saved to that file. The model previously loaded
+        is left in memory. If the configuration [option](#option) `checksum`
+        is set, a hash of the file content is compared as well. Models should
+        be removed via the client, not the Java layer, so that the index
+        stays up to date.
+
         Pass `True` to enable caching, `False` to disable it. If no argument is
         passed, the current state is returned.
         """
@@ -354,6 +502,53 @@ class Client:
             log.error(error)
             raise ValueError(error)
 
+    def limit(self,
+        count:    int = None,
+        budget:   int = None,
+        eviction: Literal['remove', 'clear'] = 'remove',
+    ):
+        """
+        Limits how many models loaded from files are kept in memory.
+
+        Once more than `count` models have been loaded, or their estimated
+        memory footprint exceeds the `budget` in bytes, the least recently
+        used models are evicted, that is, removed from memory. If `eviction`
+        is `'clear'`, models are first only cleared of their solutions, see
+        [`Model.clear()`](#clear), to stay within the budget, and removed only
+        if that does not suffice. The limits are checked whenever a model
+        is loaded or solved, and the model most recently used is never
+        evicted. Loading a model counts as using it, as does retrieving it
+        from the cache, see [`caching()`](#caching), and solving it via
+        [`Model.solve()`](#solve). Pass no limits to keep all models in
+        memory, which is the default.
+
+        The footprint of a model is estimated from how much the heap of the
+        Java VM grows while loading and, via [`Model.solve()`](#solve),
+        solving it. This is only a rough estimate, as memory is also freed
+        in the meantime. And it reflects the memory of the client's Java VM,
+        so only really applies to stand-alone clients. Models created, or
+        loaded and solved by other means, are not accounted for.
+        """
+        for (name, value) in (('count', count), ('budget', budget)):
+            if value is None:
+                continue
+            if not isinstance(value, int) or isinstance(value, bool):
+                error = f'Argument "{name}", if specified, must be an integer.'
+                log.error(error)
+                raise TypeError(error)
+            if value < 1:
+                error = f'Argument "{name}" must be at least 1.'
+                log.error(error)
+                raise ValueError(error)
+        if eviction not in ('remove', 'clear'):
+            error = 'Argument "eviction" must be either "remove" or "clear".'
+            log.error(error)
+            raise ValueError(error)
+        self.pool.count    = count
+        self.pool.budget   = budget
+        self.pool.eviction = eviction
+        self.evict()
+
     def create(self, name: str = None) -> Model:
         """
         Creates a new model and returns it as a [`Model`](#Model) instance.
@@ -363,6 +558,7 @@ class Client:
         """
         java = self.java.createUnique('model')
         model = Model(java)
+        self.registry.add(str(java.tag()), model)
         if name:
             model.rename(name)
         else:
@@ -370,22 +566,65 @@ class Client:
         log.debug(f'Created model "{name}" with tag "{java.tag()}".')
         return model
 
+    def clone(self,
+        model: Model,
+        name:  str  = None,
+        clear: bool = False,
+    ) -> Model:
+        """
+        Returns a copy of the given [`model`](#Model) as last saved to file.
+
+        This is meant for starting several jobs from the same template, say
+        one stored on a slow network drive. The file the template was loaded
+        from, or last saved to, is copied to a local temporary folder once,
+        and reloaded from there each time a clone is needed. The clone thus
+        reflects the last saved state of the template. Raises `ValueError` if
+        the template has no file or has unsaved changes, see
+        [`Model.modified()`](#modified), so save it first. The local copy is
+        replaced if the file changes.
+
+        An optional `name` can be supplied, otherwise the clone keeps the
+        template's name. Pass `clear=True` to drop solution and mesh data,
+        see [`Model.clear()`](#clear). Clones are not associated with any
+        file and do not count toward the limits set by [`limit()`](#limit).
+        """
+        if not isinstance(model, Model):
+            error = 'Model to clone must be a Model instance.'
+            log.error(error)
+            raise TypeError(error)
+        source = model.file()
+        if not source.is_file():
+            error = f'Model "{model}" has not been loaded from a file.'
+            log.error(error)
+            raise ValueError(error)
+        if model.modified():
+            error = (f'Model "{model}" has unsaved changes. Save it first '
+                     'to clone it.')
+            log.error(error)
+            raise ValueError(error)
+        copy = self.pool.local_copy(source)
+        tag = str(self.java.uniquetag('model'))
+        log.info(f'Cloning model "{model}".')
+        clone = Model(self.java.loadCopy(tag, str(copy)))
+        self.registry.add(tag, clone)
+        log.info('Finished cloning model.')
+        if clear:
+            clone.clear()
+        if name:
+            clone.rename(name)
+        return clone
+
     def remove(self, model: str | Model):
         """Removes the given [`model`](#Model) from memory."""
         if isinstance(model, str):
-            if model not in self.names():
+            found = self.registry.find(self.java, model)
+            if found is None:
                 error = f'No model named "{model}" exists.'
                 log.error(error)
                 raise ValueError(error)
-            model = self/model
+            model = found
         elif isinstance(model, Model):
-            try:
-                model.java.tag()
-            except Exception:
-                error = 'Model does not exist.'
-                log.error(error)
-                raise ValueError(error) from None
-            if model not in self.models():
+            if model not in self:
                 error = 'Model does not exist.'
                 log.error(error)
                 raise ValueError(error)
@@ -397,11 +636,15 @@ class Client:
         tag  = model.java.tag()
         log.debug(f'Removing model "{name}" with tag "{tag}".')
         self.java.remove(tag)
+        self.pool.discard(str(tag))
+        self.registry.discard(str(tag))
 
     def clear(self):
         """Removes all loaded models from memory."""
         log.debug('Clearing all models from memory.')
         self.java.clear()
+        self.pool.clear()
+        self.registry.clear()
 
     ##########
     # Remote #
@@ -431,6 +674,9 @@ class Client:
         self.java.connect(host, port)
         self.host = host
         self.port = port
+        self.pool.clear()
+        self.registry.clear()
+        self.products.clear()
 
     def disconnect(self):
         """
@@ -445,7 +691,209 @@ class Client:
             self.java.disconnect()
             self.host = None
             self.port = None
+            self.pool.clear()
+            self.registry.clear()
+            self.products.clear()
         else:
             error = 'The client is not connected to a server.'
             log.error(error)
             raise RuntimeError(error)
+
+
+class ModelPool:
+    """
+    Keeps track of the models loaded by the client.
+
+    Models are indexed by their tag and ordered by when they were last used,
+    the least recently used first. The tags are also indexed by the files
+    the models were loaded from, along with the file signatures returned by
+    `stamp()` at the time. Their estimated memory footprint is the growth of
+    the Java VM's heap while loading them plus what they report as their own
+    [`footprint`](#Model.footprint) from solving. Local copies of the files
+    that models are cloned from are kept in a temporary folder, which is
+    deleted when the pool is cleared or the Python session ends.
+    """
+
+    def __init__(self):
+        self.models: OrderedDict[str, Model] = OrderedDict()
+        self.loaded: dict[str, int] = {}
+        self.files:  dict[Path, tuple[str, tuple[int, int, str | None]]] = {}
+        self.copies: dict[Path, tuple[Path, tuple[int, int, str | None]]] = {}
+        self.folder: Path | None = None
+        self.count:  int | None = None
+        self.budget: int | None = None
+        self.eviction = 'remove'
+        self.evicted  = 0
+
+    def add(self,
+        tag:       str,
+        model:     Model,
+        footprint: int,
+        file:      Path,
+        signature: tuple[int, int, str | None] | None,
+    ):
+        """
+        Adds a freshly loaded model along with its file and footprint.
+
+        The file is only indexed if its `signature` is given, which is not
+        the case if the file does not exist.
+        """
+        self.models[tag] = model
+        self.loaded[tag] = footprint
+        if signature is None:
+            return
+        entry = self.files.get(file)
+        if entry is None or entry[1] != signature:
+            self.files[file] = (tag, signature)
+
+    def touch(self, tag: str) -> Model | None:
+        """Marks the model as most recently used and returns it, if pooled."""
+        model = self.models.get(tag)
+        if model is not None:
+            self.models.move_to_end(tag)
+        return model
+
+    def discard(self, tag: str):
+        """Stops keeping track of the model, if pooled."""
+        model = self.models.pop(tag, None)
+        if model is not None:
+            model.state.solved = None
+        self.loaded.pop(tag, None)
+        for (file, (other, _)) in list(self.files.items()):
+            if other == tag:
+                del self.files[file]
+
+    def clear(self):
+        """Stops keeping track of any models."""
+        for model in self.models.values():
+            model.state.solved = None
+        self.models.clear()
+        self.loaded.clear()
+        self.files.clear()
+        self.copies.clear()
+        if self.folder:
+            rmtree(self.folder, ignore_errors=True)
+            self.folder = None
+
+    def local_copy(self, source: Path) -> Path:
+        """Returns an up-to-date local copy of the source file."""
+        signature = stamp(source)
+        entry = self.copies.get(source)
+        if entry:
+            (copy, previous) = entry
+            if previous == signature and copy.exists():
+                return copy
+        else:
+            if self.folder is None:
+                self.folder = Path(mkdtemp(prefix='MPh_'))
+                atexit.register(rmtree, self.folder, ignore_errors=True)
+            copy = self.folder/f'{len(self.copies)}_{source.name}'
+        log.debug(f'Copying "{source}" to "{copy}".')
+        copyfile(source, copy)
+        self.copies[source] = (copy, signature)
+        return copy
+
+    def footprint(self, tag: str) -> int:
+        """Returns the estimated memory footprint of the model."""
+        return self.loaded[tag] + self.models[tag].footprint
+
+    def bytes(self) -> int:
+        """Returns the estimated memory footprint of all models."""
+        return sum(self.footprint(tag) for tag in self.models)
+
+
+class Registry:
+    """
+    Holds the wrappers of all models in the Comsol session.
+
+    There is one [`Model`](#Model) instance per model tag, created when the
+    model is first encountered, so that each model is always represented by
+    the same wrapper and its caches. Tags are also indexed by model name.
+    A name is verified whenever it is looked up. If that fails, only models
+    new to the index, or renamed via [`Model.rename()`](#rename) since they
+    were indexed, have their names queried. Models renamed via the Java
+    layer are only noticed when the name they were indexed under is looked
+    up.
+    """
+
+    def __init__(self):
+        self.models:  dict[str, Model] = {}
+        self.names:   dict[str, str]   = {}
+        self.indexed: dict[str, int]   = {}
+
+    def sync(self, java: JClass) -> list[str]:
+        """Returns the tags of all models and forgets about removed ones."""
+        tags = [str(tag) for tag in java.tags()]
+        for tag in set(self.models).difference(tags):
+            self.discard(tag)
+        return tags
+
+    def wrap(self, java: JClass, tag: str) -> Model:
+        """Returns the wrapper of the model with the given tag."""
+        model = self.models.get(tag)
+        if model is None:
+            model = Model(java.model(tag))
+            self.models[tag] = model
+        return model
+
+    def add(self, tag: str, model: Model):
+        """Registers the wrapper of a newly created or loaded model."""
+        self.models[tag] = model
+
+    def find(self, java: JClass, name: str) -> Model | None:
+        """Returns the (first) model with the given name, if any."""
+        tag = self.names.get(name)
+        if tag in self.models:
+            model = self.models[tag]
+            try:
+                if model.name() == name:
+                    return model
+            except Exception:
+                log.debug(f'Model with tag "{tag}" no longer exists.')
+            self.forget(tag)
+        for tag in self.sync(java):
+            model = self.wrap(java, tag)
+            if self.indexed.get(tag) == model.state.renamed:
+                continue
+            self.forget(tag)
+            self.names.setdefault(model.name(), tag)
+            self.indexed[tag] = model.state.renamed
+        tag = self.names.get(name)
+        return None if tag is None else self.models[tag]
+
+    def forget(self, tag: str):
+        """Removes the model with the given tag from the name index."""
+        self.indexed.pop(tag, None)
+        for (name, other) in list(self.names.items()):
+            if other == tag:
+                del self.names[name]
+
+    def discard(self, tag: str):
+        """Forgets about the model with the given tag."""
+        self.models.pop(tag, None)
+        self.forget(tag)
+
+    def clear(self):
+        """Forgets about all models."""
+        self.models.clear()
+        self.names.clear()
+        self.indexed.clear()
+
+
+def stamp(file: Path, checksum: bool = False) -> tuple[int, int, str | None]:
+    """
+    Returns the signature of the given file.
+
+    That is its modification time in nanoseconds, its size in bytes, and,
+    if `checksum` is set, the SHA-256 hash of its content. `None` is
+    returned for the hash otherwise.
+    """
+    status = file.stat()
+    digest = None
+    if checksum:
+        hasher = sha256()
+        with file.open('rb') as stream:
+            while chunk := stream.read(2**20):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+    return (status.st_mtime_ns, status.st_size, digest)
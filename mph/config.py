@@ -14,12 +14,14 @@ from typing import overload, TypedDict
 class Options(TypedDict):
     session:  str
     caching:  bool
+    checksum: bool
     classkit: bool
 
 
 options = {
     'session':  'client-server',
     'caching':  False,
+    'checksum': False,
     'classkit': False,
 }
 """Default values for configuration options."""
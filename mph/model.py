@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 from .node import Node
-
-from numpy    import array, ndarray
+from .node import Handles
+from .node import Snapshot
+from .node import convert
+from .node import cast
+from .node import get
+
+from numpy    import array, ndarray, empty, stack
+from numpy    import asarray
+from numpy    import linspace, meshgrid
 from numpy    import integer
+from numpy    import savez, load
+from numpy.lib.format import open_memmap
 
-from pathlib  import Path
-from re       import match
-from logging  import getLogger
+from pathlib   import Path
+from re        import match
+from ast       import literal_eval
+from functools import wraps
+from logging   import getLogger
 
 from jpype           import JClass
-from typing          import overload, Literal
-from collections.abc import Iterator
+from typing          import overload, Literal, Any, ParamSpec, TypeVar
+from collections.abc import Iterator, Callable
+from collections     import OrderedDict
 from numpy.typing    import ArrayLike, NDArray
 from numpy           import int32, float64
 
@@ -80,6 +92,20 @@ modules = {
 
 log = getLogger(__package__)
 
+Arguments = ParamSpec('Arguments')
+Result    = TypeVar('Result')
+
+
+def pooled(
+    method: Callable[Arguments, Result],
+) -> Callable[Arguments, Result]:
+    """Removes pooled evaluation features when the model method returns."""
+    @wraps(method)
+    def wrapper(*arguments: Arguments.args, **options: Arguments.kwargs):
+        with arguments[0].pool:
+            return method(*arguments, **options)
+    return wrapper
+
 
 class Model:
     """
@@ -119,6 +145,13 @@ class Model:
     "type-cast" an existing `Model` instance (as loaded by the client) to a
     derived child class.
 
+    Each instance caches the Java objects that [node](#Node) references have
+    resolved to, which speeds up repeated access to the same nodes. The cache
+    is kept up to date when the model tree is changed via this library. If it
+    is modified directly via the Java layer, call [`refresh()`](#refresh).
+    Caching of evaluation results is opt-in, see
+    [`cache_results()`](#cache_results).
+
     [1]: https://doc.comsol.com/6.0/doc/com.comsol.help.comsol/api\
 /com/comsol/model/Model.html
     """
@@ -136,14 +169,51 @@ class Model:
 
     def __init__(self, parent: JClass | Model):
         if isinstance(parent, Model):
-            java = parent.java
+            java    = parent.java
+            handles = parent.handles
+            pool    = parent.pool
+            results = parent.results
+            state   = parent.state
         else:
-            java = parent
-        self.java = java
+            java    = parent
+            handles = Handles()
+            pool    = EvaluationPool()
+            results = Results()
+            state   = State()
+        self.java    = java
+        self.handles = handles
+        self.pool    = pool
+        self.results = results
+        self.state   = state
 
     def __str__(self) -> str:
         return self.name()
 
+    @property
+    def footprint(self) -> int:
+        """
+        Estimated memory, in bytes, taken up by the solutions of the model.
+
+        The estimate is the growth of the Java VM's heap while solving. It is
+        reset when the solutions are cleared.
+        """
+        return self.state.footprint
+
+    @footprint.setter
+    def footprint(self, footprint: int):
+        self.state.footprint = footprint
+
+    @property
+    def saved(self) -> tuple[Path, int, int] | None:
+        """
+        File the model was last saved to, along with the file's signature.
+
+        That is the resolved file path, its modification time in nanoseconds,
+        and its size in bytes, right after the model was last saved in Comsol
+        format via [`save()`](#save). `None` if it has not been saved yet.
+        """
+        return self.state.saved
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self}')"
 
@@ -167,6 +237,141 @@ class Model:
     def __iter__(self) -> Iterator[Node]:
         yield from (self/None).children()
 
+    # Returns the given dataset, or the default dataset if none is given,
+    # along with its feature type and the solution it refers to. The results
+    # are memoized until the model tree is changed via the MPh API. Datasets
+    # may be passed by name or as a node.
+    def lookup(self,
+        dataset: str | Node | None,
+    ) -> tuple[Node, str | None, Node]:
+        memo = self.handles.memo
+        if dataset is None:
+            dataset = self.default()
+        elif isinstance(dataset, str):
+            dataset = self/'datasets'/dataset
+        elif not isinstance(dataset, Node):
+            error = 'Dataset must be a dataset name or dataset node.'
+            log.error(error)
+            raise TypeError(error)
+        key = ('dataset', dataset.path)
+        entry = memo.get(key)
+        if entry:
+            (type, solution) = entry
+            return (dataset, type, solution)
+        if not dataset.exists():
+            error = f'Dataset "{dataset.name()}" does not exist.'
+            log.error(error)
+            raise ValueError(error)
+        # Follow derived datasets, such as cut points, to the solution.
+        solutions = {solution.tag(): solution for solution in self/'solutions'}
+        datasets = (self/'datasets').java
+        tags = {str(tag) for tag in datasets.tags()}
+        java = dataset.java
+        visited = set()
+        while True:
+            names = [str(name) for name in java.properties()]
+            tag = None
+            if 'solution' in names:
+                tag = str(java.getString('solution'))
+            elif 'data' in names:
+                tag = str(java.getString('data'))
+            if tag in solutions or tag not in tags or tag in visited:
+                break
+            visited.add(tag)
+            java = datasets.get(tag)
+        solution = solutions.get(tag)
+        if solution is None:
+            error = f'Dataset "{dataset.name()}" does not refer to a solution.'
+            log.error(error)
+            raise RuntimeError(error)
+        type = dataset.type()
+        memo[key] = (type, solution)
+        return (dataset, type, solution)
+
+    # Determines the default dataset, i.e. the one that a newly created
+    # evaluation feature refers to, by creating such a feature temporarily.
+    # The result is memoized along with the datasets.
+    def default(self) -> Node:
+        memo = self.handles.memo
+        key = ('default',)
+        if key in memo:
+            return memo[key]
+        evaluations = self/'evaluations'
+        java = evaluations.java.create(
+            evaluations.java.uniquetag('eval'), 'Eval'
+        )
+        try:
+            tag = str(java.getString('data'))
+        finally:
+            evaluations.java.remove(java.tag())
+        for dataset in self/'datasets':
+            if dataset.tag() == tag:
+                memo[key] = dataset
+                return dataset
+        error = 'Could not determine default dataset.'
+        log.error(error)
+        raise RuntimeError(error)
+
+    # Returns the Java object of the model component that a solution dataset
+    # refers to. Datasets name it in their "comp" property if the model has
+    # more than one component. Otherwise it is the first and only one.
+    def component(self, dataset: Node) -> JClass:
+        components = self.java.component()
+        tags = [str(tag) for tag in components.tags()]
+        if not tags:
+            error = 'Model has no components.'
+            log.error(error)
+            raise RuntimeError(error)
+        tag = tags[0]
+        java = dataset.java
+        if 'comp' in [str(name) for name in java.properties()]:
+            name = str(java.getString('comp'))
+            if name in tags:
+                tag = name
+        return self.java.component(tag)
+
+    # Returns the spatial dimension of the geometry of the model component
+    # that a solution dataset refers to. That is also the dimension of the
+    # component's domains.
+    def dimension(self, dataset: Node) -> int:
+        component = self.component(dataset)
+        geometries = [str(tag) for tag in component.geom().tags()]
+        if not geometries:
+            error = f'Component of dataset "{dataset.name()}" has no geometry.'
+            log.error(error)
+            raise RuntimeError(error)
+        return int(component.geom(geometries[0]).getSDim())
+
+    # Returns the names of the spatial coordinates of a solution dataset, as
+    # defined by the spatial frame of its component. Those are "x", "y", "z"
+    # by default, but only "r" and "z" in axisymmetric geometries, and may
+    # have been renamed by the user. The result is memoized.
+    def axes(self, dataset: Node) -> list[str]:
+        memo = self.handles.memo
+        key = ('axes', dataset.path)
+        if key in memo:
+            return memo[key]
+        component = self.component(dataset)
+        geometries = [str(tag) for tag in component.geom().tags()]
+        if geometries:
+            geometry = component.geom(geometries[0])
+            dimension = int(geometry.getSDim())
+            axisymmetric = bool(geometry.axisymmetric())
+        else:
+            (dimension, axisymmetric) = (3, False)
+        try:
+            frames = [str(tag) for tag in component.frame().tags()]
+            frame = next(tag for tag in frames if tag.startswith('spatial'))
+            names = [str(name) for name in component.frame(frame).coord()]
+        except Exception:
+            log.debug('Could not read coordinate names from spatial frame.')
+            names = ['r', 'phi', 'z'] if axisymmetric else ['x', 'y', 'z']
+        if axisymmetric:
+            names = [names[0], names[2]]
+        axes = names[:dimension]
+        memo[key] = axes
+        return axes
+
     ##############
     # Inspection #
     ##############
@@ -182,6 +387,16 @@ class Model:
         """Returns the absolute path to the file the model was loaded from."""
         return Path(str(self.java.getFilePath())).resolve()
 
+    def modified(self) -> bool:
+        """
+        Checks if the model has been changed since it was loaded or saved.
+
+        Only changes made via MPh are noticed, such as setting parameters or
+        properties, or solving the model, not those made via the Java layer.
+        Saving counts only in Comsol format, as does [`saved`](#saved).
+        """
+        return (self.handles.version != self.state.version)
+
     def version(self) -> str:
         """Returns the Comsol version the model was last saved with."""
         version = str(self.java.getComsolVersion())
@@ -256,6 +471,71 @@ class Model:
         """
         return (self/None).problems()
 
+    def snapshot(self, properties: bool = False) -> Snapshot:
+        """
+        Captures the entire model tree in an immutable snapshot.
+
+        See [`Node.snapshot()`](#Node.snapshot) for details. Set `properties`
+        to `True` to also record the properties of all nodes.
+        """
+        return (self/None).snapshot(properties)
+
+    def caches(self) -> dict[str, dict[str, int]]:
+        """
+        Returns statistics about the model's internal caches.
+
+        The statistics are returned as a dictionary indexed by the name of the
+        cache. For each, it holds another dictionary with the number of cached
+        entries (`'size'`) as well as cache `'hits'` and `'misses'` counted so
+        far. The `'nodes'` cache holds the Java objects of resolved node
+        references. The `'containers'` cache indexes the names and tags of
+        child nodes, where a hit means that an index was reused without any
+        changes to the child nodes. The `'evaluations'` cache holds the
+        numerical evaluation features reused by [`evaluate()`](#evaluate)
+        within a [`batch()`](#batch) of evaluations. The `'results'` cache
+        holds evaluation results if enabled via
+        [`cache_results()`](#cache_results), and also reports their total size
+        in `'bytes'`.
+        """
+        return {
+            **self.handles.statistics(),
+            'evaluations': self.pool.statistics(),
+            'results':     self.results.statistics(),
+        }
+
+    def cache_results(self, budget: int = 2**28, file: Path | str = None):
+        """
+        Enables caching of evaluation results up to a `budget` of bytes.
+
+        Once enabled, [`evaluate()`](#evaluate) returns the results of an
+        evaluation it already performed from memory, instead of computing
+        them anew, provided the model has not been changed in the meantime
+        by solving it, clearing it, or setting parameters or node properties.
+        The least recently used results are discarded when the cached arrays
+        would exceed the memory budget, which is 256 MiB by default. Set the
+        budget to 0 to disable the cache and discard all its entries.
+
+        If a `file` is given, cached results are loaded from it, provided
+        they were obtained from the same, unmodified model file. They are
+        saved to that file the next time this method is called, for example
+        to disable the cache at the end of a session. Only results obtained
+        before the model was first changed are saved, as only those can be
+        reproduced from the model file.
+        """
+        results = self.results
+        if results.file:
+            results.save(results.file)
+        try:
+            path = self.file()
+            origin = f'{path}:{path.stat().st_mtime_ns}'
+        except Exception:
+            origin = ''
+        results.origin = origin
+        results.resize(max(budget, 0))
+        results.file = Path(file) if file else None
+        if results.file and results.budget and results.file.exists():
+            results.load(results.file)
+
     ###########
     # Solving #
     ###########
@@ -344,8 +624,12 @@ class Model:
         nodes = [study] if study else studies.children()
         for node in nodes:
             log.info(f'Running study "{node.name()}".')
+            before = memory()
             node.run()
+            self.footprint += max(memory() - before, 0)
             log.info('Finished solving study.')
+        if self.state.solved:
+            self.state.solved()
 
     ##############
     # Evaluation #
@@ -362,37 +646,14 @@ class Model:
         array. A `dataset` name may be specified. Otherwise the default dataset
         is used.
         """
-        # Validate dataset argument.
-        if dataset is not None:
-            if isinstance(dataset, str):
-                dataset = self/'datasets'/dataset
-            if not isinstance(dataset, Node):
-                error = 'Dataset must be a dataset name or dataset node.'
-                log.error(error)
-                raise TypeError(error)
-        if not dataset.exists():
-            error = f'Dataset "{dataset.name()}" does not exist.'
-            log.error(error)
-            raise ValueError(error)
-
-        # Find corresponding solution.
-        if 'solution' in dataset.properties():
-            tag = dataset.property('solution')
-        elif 'data' in dataset.properties():
-            tag = dataset.property('data')
-        for solution in self/'solutions':
-            if solution.tag() == tag:
-                break
-        else:
-            error = f'Dataset "{dataset.name()}" does not refer to a solution.'
-            log.error(error)
-            raise RuntimeError(error)
+        # Find the dataset and its solution.
+        (dataset, _, solution) = self.lookup(dataset)
 
         # Get indices from solution info and values from solution itself.
         java    = solution.java
         info    = java.getSolutioninfo()
-        indices = array(info.getSolnum(1, True))
-        values  = array(java.getPVals())
+        indices = convert(info.getSolnum(1, True))
+        values  = convert(java.getPVals())
         return (indices, values)
 
     def outer(self,
@@ -404,39 +665,50 @@ class Model:
         These are the solution indices and values in parametric sweeps,
         returned as a tuple of an integer array and a floating-point array. A
         `dataset` name may be specified. Otherwise the default dataset is used.
-        """
-        # Validate dataset argument.
-        if dataset is not None:
-            if isinstance(dataset, str):
-                dataset = self/'datasets'/dataset
-            if not isinstance(dataset, Node):
-                error = 'Dataset must be a dataset name or dataset node.'
-                log.error(error)
-                raise TypeError(error)
-        if not dataset.exists():
-            error = f'Dataset "{dataset.name()}" does not exist.'
-            log.error(error)
-            raise ValueError(error)
 
-        # Find corresponding solution.
-        if 'solution' in dataset.properties():
-            tag = dataset.property('solution')
-        elif 'data' in dataset.properties():
-            tag = dataset.property('data')
-        for solution in self/'solutions':
-            if solution.tag() == tag:
-                break
-        else:
-            error = f'Dataset "{dataset.name()}" does not refer to a solution.'
-            log.error(error)
-            raise RuntimeError(error)
+        If the sweep varies more than one parameter, the values are returned
+        as a structured NumPy array instead, with one named field per
+        parameter, such as `values['U']`.
+        """
+        # Find the dataset and its solution.
+        (dataset, _, solution) = self.lookup(dataset)
 
-        # Get indices and values from solution info.
+        # Get indices from solution info.
         info = solution.java.getSolutioninfo()
-        indices = array(info.getOuterSolnum())
-        values = array([info.getPvals([[index,1]])[0][0] for index in indices])
+        indices = convert(info.getOuterSolnum())
+        if not len(indices):
+            return (indices, array([]))
+
+        # Get parameter values of all outer solutions in one go.
+        pairs = empty((len(indices), 2), dtype=int32)
+        pairs[:, 0] = indices
+        pairs[:, 1] = 1
+        table = convert(info.getPvals(cast(pairs)))
+        table = table.reshape(len(indices), -1)
+        if table.shape[1] == 1:
+            return (indices, table[:, 0])
+
+        # Return a structured array if several parameters are varied.
+        names = [str(name) for name in info.getPNames()]
+        values = empty(len(indices), dtype=[(name, float64) for name in names])
+        for (column, name) in enumerate(names):
+            values[name] = table[:, column]
         return (indices, values)
 
+    def batch(self) -> EvaluationPool:
+        """
+        Returns a context manager for a batch of evaluations.
+
+        The numerical evaluation features that [`evaluate()`](#evaluate)
+        needs are added to the model's `evaluations` group and removed again
+        right after. Inside a `with model.batch():` block, they are kept and
+        merely reconfigured by subsequent evaluations, one feature per type
+        and dataset, which saves the round trips to create and remove them.
+        They are removed when the outermost such block is left.
+        """
+        return self.pool
+
+    @overload
     def evaluate(self,
         expression: str | list[str],
         unit:       str | list[str]                = None,
@@ -444,7 +716,105 @@ class Model:
         inner:      Literal['first', 'last']
                     | list[int] | NDArray[integer] = None,
         outer:      int | integer                  = None,
-    ) -> NDArray[float64] | list[NDArray[float64]]:
+        kind:       Literal['global', 'field', 'particle'] = None,
+        out:        None = None,
+        lazy:       Literal[False]                 = False,
+        selection:  str | Node | int
+                    | list[int] | NDArray[integer] = None,
+        refine:     int | str                      = None,
+        smooth:     str                            = None,
+    ) -> NDArray[float64] | list[NDArray[float64]]: ...
+    @overload
+    def evaluate(self,
+        expression: str | list[str],
+        unit:       str | list[str]                = None,
+        dataset:    str | Node                     = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        *,
+        outer:      Literal['all'] | list[int] | NDArray[integer],
+        kind:       Literal['global', 'field', 'particle'] = None,
+        out:        None = None,
+        lazy:       Literal[False]                 = False,
+        selection:  str | Node | int
+                    | list[int] | NDArray[integer] = None,
+        refine:     int | str                      = None,
+        smooth:     str                            = None,
+    ) -> tuple[NDArray[int32], NDArray[float64],
+               NDArray[float64] | list[NDArray[float64]]]: ...
+    @overload
+    def evaluate(self,
+        expression: str | list[str],
+        unit:       str | list[str] | None,
+        dataset:    str | Node | None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] | None,
+        outer:      Literal['all'] | list[int] | NDArray[integer],
+        kind:       Literal['global', 'field', 'particle'] = None,
+        out:        None = None,
+        lazy:       Literal[False]                 = False,
+        selection:  str | Node | int
+                    | list[int] | NDArray[integer] = None,
+        refine:     int | str                      = None,
+        smooth:     str                            = None,
+    ) -> tuple[NDArray[int32], NDArray[float64],
+               NDArray[float64] | list[NDArray[float64]]]: ...
+    @overload
+    def evaluate(self,
+        expression: str | list[str],
+        unit:       str | list[str]                = None,
+        dataset:    str | Node                     = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        outer:      int | integer                  = None,
+        kind:       Literal['global', 'field', 'particle'] = None,
+        *,
+        out:        str | Path | ndarray,
+        lazy:       Literal[False]                 = False,
+        selection:  str | Node | int
+                    | list[int] | NDArray[integer] = None,
+        refine:     int | str                      = None,
+        smooth:     str                            = None,
+    ) -> NDArray | Path: ...
+    @overload
+    def evaluate(self,
+        expression: str | list[str],
+        unit:       str | list[str]                = None,
+        dataset:    str | Node                     = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        outer:      int | integer                  = None,
+        kind:       Literal['global', 'field', 'particle'] = None,
+        out:        None = None,
+        *,
+        lazy:       Literal[True],
+        selection:  str | Node | int
+                    | list[int] | NDArray[integer] = None,
+        refine:     int | str                      = None,
+        smooth:     str                            = None,
+    ) -> Deferred | list[Deferred]: ...
+    @pooled
+    def evaluate(self,
+        expression: str | list[str],
+        unit:       str | list[str]                = None,
+        dataset:    str | Node                     = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        outer:      int | integer | Literal['all']
+                    | list[int] | NDArray[integer] = None,
+        kind:       Literal['global', 'field', 'particle'] = None,
+        out:        str | Path | ndarray           = None,
+        lazy:       bool                           = False,
+        selection:  str | Node | int
+                    | list[int] | NDArray[integer] = None,
+        refine:     int | str                      = None,
+        smooth:     str                            = None,
+    ) -> (
+        NDArray[float64] | list[NDArray[float64]]
+        | tuple[NDArray[int32], NDArray[float64],
+                NDArray[float64] | list[NDArray[float64]]]
+        | Path | Deferred | list[Deferred]
+    ):
         """
         Evaluates an expression and returns the numerical results.
 
@@ -455,14 +825,71 @@ class Model:
         Results are returned as (lists of) [NumPy arrays](#ndarray), of
         whichever dimensionality they may then have.
 
-        A `dataset` may be specified, but it must be a solution dataset.
-        Derived datasets are not supported. If no dataset is given, the
+        A `dataset` may be specified, either a solution dataset or one
+        derived from it, such as cut points. If no dataset is given, the
         expression will be evaluated on the default dataset. If the solution
         stored in the dataset is time-dependent, one or several `inner`
         solutions can be preselected, either by an index number, a sequence of
         indices, or by passing `'first`'/`'last'` to select the very
         first/last index. If the dataset represents a parameter sweep, the
-        `outer` solution(s) can be selected by index or sequence of indices.
+        `outer` solution can be selected by index.
+
+        To evaluate on several outer solutions at once, pass a list or array
+        of indices as `outer`, or `'all'` for all of them. The return value
+        is then a tuple `(indices, values, results)` of the outer indices, the
+        parameter values as returned by [`outer()`](#outer), and the results,
+        which gain a leading axis that runs over the outer solutions. If the
+        results differ in shape from one outer solution to the next, such as
+        when time steps vary across the sweep, that leading axis is an array
+        of objects, each an array of its own.
+
+        Unless the `kind` of expression is specified as `'global'`, `'field'`,
+        or `'particle'`, it is first tried as a global expression, and then
+        evaluated on the dataset's mesh or particles if that fails. Which of
+        these worked is remembered for subsequent evaluations of the same
+        expression on the same dataset, until the model tree is changed.
+
+        Once [`coordinates()`](#coordinates) has been called for a dataset,
+        field evaluations of the spatial coordinates, without a `unit` and
+        for the first inner solution, return read-only views of the cached
+        coordinates instead of fresh arrays. Copy those results before
+        modifying them in place.
+
+        Large results can be written to disk as they are computed, instead of
+        being held in memory all at once, by passing an `out` file path or a
+        pre-allocated array, such as a NumPy `memmap`. The results are then
+        evaluated one inner solution at a time, and written to `out` along
+        its leading axis, or its second axis if there are several expressions.
+        File paths ending in `.npy` are written as NumPy arrays and a
+        memory-map of the file is returned. Paths ending in `.h5` or `.hdf5`
+        are written as HDF5 files, with the results stored in a dataset named
+        `results` and the expressions in its attributes. This requires the
+        [h5py](https://www.h5py.org) library to be installed, and the path is
+        returned in that case. Pre-allocated arrays are returned after having
+        been filled in.
+
+        Field evaluations can be restricted to a `selection`, either the name
+        of a selection node, the node itself, or a domain number or list/array
+        of them. Domain numbers refer to the geometry of the dataset's model
+        component and are only accepted for solution datasets. To evaluate
+        on boundaries, edges, or points, create a selection node for them.
+        The resolution of the results may be controlled with `refine`, the
+        number of points per mesh element in each direction, or `'auto'`,
+        and `smooth`, which is either `'none'`, `'material'`, `'internal'`,
+        or `'everywhere'`, meaning across which element boundaries results
+        are smoothed. Neither of these options applies to global or particle
+        evaluations.
+
+        If `lazy` is `True`, nothing is evaluated right away. Instead, a
+        [`Deferred`](#Deferred) result is returned for the expression, or a
+        list of them for several expressions. They evaluate only those inner
+        solutions that are eventually selected by indexing them, or all of
+        them when converted to an array.
+
+        The numerical evaluation features needed to compute the results are
+        temporarily added to the model's `evaluations` group. When evaluating
+        many times in a row, do so inside a [`batch()`](#batch) so that they
+        are reused.
 
         With the help of appropriately defined operators in the model, this
         method here should be able to query any and all data. If you don't
@@ -471,13 +898,6 @@ class Model:
         in the Comsol Programming Manual for guidance.
         """
         # Validate input arguments.
-        if dataset is not None:
-            if isinstance(dataset, str):
-                dataset = self/'datasets'/dataset
-            if not isinstance(dataset, Node):
-                error = 'Dataset must be a dataset name or dataset node.'
-                log.error(error)
-                raise TypeError(error)
         if not (inner is None
                 or (isinstance(inner, str) and inner in ('first', 'last'))
                 or (isinstance(inner, list)
@@ -487,42 +907,155 @@ class Model:
                      '"first", "last", or a list/array of integers.')
             log.error(error)
             raise TypeError(error)
-        if outer is not None and not isinstance(outer, (int, integer)):
-            error = 'Argument "outer", if specified, must be an integer index.'
+        # Arrays would be compared element-wise with "first" and "last".
+        if isinstance(inner, ndarray):
+            inner = inner.tolist()
+        if not (outer is None
+                or isinstance(outer, (int, integer))
+                or (isinstance(outer, str) and outer == 'all')
+                or (isinstance(outer, list)
+                    and all(isinstance(index, int) for index in outer))
+                or (isinstance(outer, ndarray) and outer.dtype.kind == 'i')):
+            error = ('Argument "outer", if specified, must be either an '
+                     'integer index, "all", or a list/array of integers.')
             log.error(error)
             raise TypeError(error)
-
-        # Find the default dataset if nothing specified.
-        if not dataset:
-            eval = (self/'evaluations').create('Eval')
-            tag  = eval.property('data')
-            eval.remove()
-            for dataset in self/'datasets':
-                if dataset.tag() == tag:
-                    break
-            else:
-                error = 'Could not determine default dataset.'
+        if kind not in (None, 'global', 'field', 'particle'):
+            error = ('Argument "kind", if specified, must be either '
+                     '"global", "field", or "particle".')
+            log.error(error)
+            raise ValueError(error)
+        if out is not None and lazy:
+            error = 'Cannot write results to "out" when evaluating lazily.'
+            log.error(error)
+            raise ValueError(error)
+        if isinstance(selection, str):
+            selection = self/'selections'/selection
+        if isinstance(selection, Node):
+            if not selection.exists():
+                error = f'Selection "{selection.name()}" does not exist.'
                 log.error(error)
-                raise RuntimeError(error)
-
-        if not dataset.exists():
-            error = f'Dataset "{dataset.name()}" does not exist.'
+                raise ValueError(error)
+        elif (isinstance(selection, (int, integer))
+              and not isinstance(selection, bool)):
+            selection = [int(selection)]
+        elif not (selection is None
+                  or (isinstance(selection, list)
+                      and all(isinstance(entity, int)
+                              for entity in selection))
+                  or (isinstance(selection, ndarray)
+                      and selection.dtype.kind == 'i')):
+            error = ('Argument "selection", if specified, must be a '
+                     'selection name or node, an integer, or a list/array '
+                     'of integers.')
+            log.error(error)
+            raise TypeError(error)
+        if not (refine is None
+                or (isinstance(refine, (int, integer))
+                    and not isinstance(refine, bool) and refine >= 1)
+                or (isinstance(refine, str) and refine == 'auto')):
+            error = ('Argument "refine", if specified, must be a positive '
+                     'integer or "auto".')
             log.error(error)
             raise ValueError(error)
-        log.info(f'Evaluating "{expression}" on dataset "{dataset.name()}".')
-
-        # Find corresponding solution.
-        if 'solution' in dataset.properties():
-            tag = dataset.property('solution')
-        elif 'data' in dataset.properties():
-            tag = dataset.property('data')
-        for solution in self/'solutions':
-            if solution.tag() == tag:
-                break
-        else:
-            error = f'Dataset "{dataset.name()}" does not refer to a solution.'
+        if smooth not in (None, 'none', 'material', 'internal', 'everywhere'):
+            error = ('Argument "smooth", if specified, must be either "none", '
+                     '"material", "internal", or "everywhere".')
             log.error(error)
-            raise RuntimeError(error)
+            raise ValueError(error)
+        options = {'selection': selection, 'refine': refine, 'smooth': smooth}
+        restricted = any(value is not None for value in options.values())
+
+        # Find the dataset, or the default one, and its solution.
+        (dataset, type, solution) = self.lookup(dataset)
+
+        # Defer the evaluation if so requested.
+        if lazy:
+            if isinstance(outer, (str, list, ndarray)):
+                error = ('Argument "outer" must be a single index, if any, '
+                         'when evaluating lazily.')
+                log.error(error)
+                raise TypeError(error)
+            info = solution.java.getSolutioninfo()
+            indices = convert(
+                info.getSolnum(1 if outer is None else outer, True)
+            )
+            if inner == 'first':
+                indices = indices[:1]
+            elif inner == 'last':
+                indices = indices[-1:]
+            elif inner is not None:
+                indices = array(inner)
+            if isinstance(expression, (list, tuple)):
+                units = unit if isinstance(unit, (list, tuple)) else (
+                    [unit] * len(expression)
+                )
+                return [
+                    Deferred(self, item, part, dataset, indices, outer, kind,
+                             options)
+                    for (item, part) in zip(expression, units, strict=True)
+                ]
+            return Deferred(self, expression, unit, dataset, indices, outer,
+                            kind, options)
+
+        # Write results to disk or array, one inner solution at a time.
+        if out is not None:
+            if isinstance(outer, (str, list, ndarray)):
+                error = ('Argument "outer" must be a single index, if any, '
+                         'when writing results to "out".')
+                log.error(error)
+                raise TypeError(error)
+            return self.write(
+                out, expression, unit, dataset, solution, inner, outer, kind,
+                options,
+            )
+
+        # Evaluate on several outer solutions, one after the other. The
+        # evaluation feature is reused, so only the outer index changes.
+        if isinstance(outer, (str, list, ndarray)):
+            (indices, values) = self.outer(dataset)
+            if not len(indices):
+                error = f'Dataset "{dataset.name()}" has no outer solutions.'
+                log.error(error)
+                raise ValueError(error)
+            if not isinstance(outer, str):
+                positions = {index: position
+                             for (position, index) in enumerate(indices)}
+                missing = [index for index in outer if index not in positions]
+                if missing:
+                    error = f'No outer solutions with indices {missing}.'
+                    log.error(error)
+                    raise ValueError(error)
+                selected = [positions[index] for index in outer]
+                (indices, values) = (indices[selected], values[selected])
+            results = [
+                self.evaluate(expression, unit, dataset, inner, index, kind,
+                              **options)
+                for index in indices.tolist()
+            ]
+            if isinstance(expression, (list, tuple)):
+                results = [
+                    gather([result[n] for result in results])
+                    for n in range(len(expression))
+                ]
+            else:
+                results = gather(results)
+            return (indices, values, results)
+
+        # Return results from the cache if this evaluation was done before.
+        key = None
+        if self.results.budget:
+            key = self.results.key(
+                self.handles.version, expression, unit, dataset, inner, outer,
+                selection.tag() if isinstance(selection, Node) else selection,
+                refine, smooth,
+            )
+            cached = self.results.get(key)
+            if cached is not None:
+                log.info(f'Returning cached results of "{expression}".')
+                return cached
+
+        log.info(f'Evaluating "{expression}" on dataset "{dataset.name()}".')
 
         # Make sure solution has actually been computed.
         if solution.java.isEmpty():
@@ -530,88 +1063,111 @@ class Model:
             log.error(error)
             raise RuntimeError(error)
 
-        # Try to perform a global evaluation, which may fail.
-        eval = (self/'evaluations').create('EvalGlobal')
-        eval.property('expr', expression)
-        if unit:
-            eval.property('unit', unit)
-        eval.property('data', dataset)
-        if outer is not None:
-            eval.property('outersolnum', outer)
-        try:
-            log.debug('Trying global evaluation.')
-            java = eval.java
-            results = array(java.computeResult())
-            if java.isComplex():
-                results = results[0].astype('complex') + 1j*results[1]
-            else:
-                results = results[0]
-            log.info('Finished global evaluation.')
-            if inner is None:
-                pass
-            elif inner == 'first':
-                results = results[0]
-            elif inner == 'last':
-                results = results[-1]
-            else:
-                if isinstance(inner, list):
-                    inner = array(inner)
-                results = results[inner-1]
-            return results.squeeze()
-        # Move on if this fails. Seems to not be a global expression then.
-        except Exception:
-            log.debug('Global evaluation failed. Moving on.')
-        finally:
-            eval.remove()
-
-        # For particle datasets, create an "EvalPoint" feature.
-        if dataset.type() == 'Particle':
-            eval = (self/'evaluations').create('EvalPoint')
-            if inner in ('first', 'last'):
-                eval.property('innerinput', inner)
-            elif inner is not None:
-                eval.property('innerinput', 'manual')
-                eval.property('solnum', inner)
-        # Otherwise create an "Eval" feature.
+        # Look up how the expression was evaluated before, if at all.
+        data = dataset.tag()
+        if isinstance(expression, (list, tuple)):
+            memo = ('kind', tuple(expression), data)
+        else:
+            memo = ('kind', expression, data)
+        known = kind or self.handles.memo.get(memo)
+
+        # Let Comsol select the inner solutions, so that those not selected
+        # are neither computed nor transferred.
+        if inner in ('first', 'last'):
+            (innerinput, solnum) = (inner, None)
+        elif inner is not None:
+            (innerinput, solnum) = ('manual', inner)
         else:
-            eval = (self/'evaluations').create('Eval')
+            (innerinput, solnum) = (None, None)
+
+        # Try to perform a global evaluation, which may fail. Restricted
+        # evaluations are of fields by definition.
+        if known in (None, 'global') and not restricted:
+            try:
+                log.debug('Trying global evaluation.')
+                java = self.pool.get(self, 'EvalGlobal', dataset).configure(
+                    expr        = expression,
+                    unit        = unit or None,
+                    data        = data,
+                    outersolnum = outer,
+                    innerinput  = innerinput,
+                    solnum      = solnum,
+                )
+                results = convert(java.computeResult())
+                if java.isComplex():
+                    results = results[0].astype('complex') + 1j*results[1]
+                else:
+                    results = results[0]
+                log.info('Finished global evaluation.')
+                self.handles.memo[memo] = 'global'
+                return self.results.put(key, results.squeeze())
+            # Move on if this fails. Seems to not be a global expression then.
+            except Exception:
+                if kind == 'global':
+                    error = f'Global evaluation of "{expression}" failed.'
+                    log.error(error)
+                    raise RuntimeError(error) from None
+                log.debug('Global evaluation failed. Moving on.')
 
-        # Set up the evaluation feature.
-        eval.property('expr', expression)
-        if unit:
-            eval.property('unit', unit)
-        eval.property('data', dataset)
-        if outer is not None:
-            eval.property('outersolnum', outer)
+        # Expressions on particle datasets are evaluated at the particles.
+        if kind is None:
+            if type == 'Particle':
+                kind = 'particle'
+            else:
+                kind = 'field'
+        if restricted and kind != 'field':
+            error = ('Arguments "selection", "refine", and "smooth" only '
+                     'apply to field evaluations.')
+            log.error(error)
+            raise ValueError(error)
+
+        # For particles, use an "EvalPoint" feature, otherwise "Eval".
+        particles = (kind == 'particle')
+        evaluator = self.pool.get(
+            self, 'EvalPoint' if particles else 'Eval', dataset
+        )
+        if not particles:
+            if isinstance(selection, Node):
+                evaluator.select(selection.tag())
+            elif selection is not None:
+                if type != 'Solution':
+                    error = ('Domain numbers can only be selected on solution '
+                             'datasets. Use a named selection instead.')
+                    log.error(error)
+                    raise ValueError(error)
+                evaluator.select(array(selection), self.dimension(dataset))
+            else:
+                evaluator.select(None)
+        java = evaluator.configure(
+            expr        = expression,
+            unit        = unit or None,
+            data        = data,
+            outersolnum = outer,
+            innerinput  = innerinput,
+            solnum      = solnum,
+            refine      = refine,
+            smooth      = smooth,
+        )
 
         # Retrieve the data.
         log.info('Retrieving data.')
-        java = eval.java
-        if dataset.type() == 'Particle':
-            results = array(java.getReal())
+        if particles:
+            results = convert(java.getReal())
             if java.isComplex():
                 results = results.astype('complex')
-                results += 1j * array(java.getImag())
+                results += 1j * convert(java.getImag())
             if isinstance(expression, (tuple, list)):
                 shape = results.shape[1:]
                 results = results.reshape(len(expression), -1, *shape)
         else:
-            results = array(java.getData())
+            results = convert(java.getData())
             if java.isComplex():
                 results = results.astype('complex')
-                results += 1j * array(java.getImagData())
-            if inner == 'first':
+                results += 1j * convert(java.getImagData())
+            if inner in ('first', 'last'):
                 results = results[:, 0, :]
-            elif inner == 'last':
-                results = results[:, -1, :]
-            elif inner is not None:
-                if isinstance(inner, list):
-                    inner = array(inner)
-                results = results[:, inner-1, :]
         log.info('Finished retrieving data.')
-
-        # Remove the temporary evaluation feature we added to the model.
-        eval.remove()
+        self.handles.memo[memo] = kind
 
         # Squeeze out singleton array dimensions.
         if isinstance(expression, (list, tuple)):
@@ -619,8 +1175,455 @@ class Model:
         else:
             results = results.squeeze()
 
+        # Share memory with coordinates cached for the first inner solution.
+        if kind == 'field' and not restricted and (
+                inner is None or (isinstance(inner, str)
+                                  and inner == 'first')):
+            results = self.share(expression, unit, dataset, outer, results)
+
         # Return array of results.
-        return results
+        return self.results.put(key, results)
+
+    def evaluate_iter(self,
+        expression: str | list[str],
+        unit:       str | list[str] = None,
+        dataset:    str | Node      = None,
+        chunk:      int             = 1,
+        outer:      int | integer   = None,
+        kind:       Literal['global', 'field', 'particle'] = None,
+        selection:  str | Node | int | list[int] | NDArray[integer] = None,
+        refine:     int | str       = None,
+        smooth:     str             = None,
+    ) -> Iterator[NDArray[float64] | list[NDArray[float64]]]:
+        """
+        Evaluates an expression chunk by chunk of inner solutions.
+
+        This is a generator that works like [`evaluate()`](#evaluate), but
+        yields the results for only `chunk` inner solutions, such as time
+        steps, at a time. Each block of results is the same as what
+        `evaluate()` returns when passing those inner solution indices as
+        `inner`. Only one such block is held in memory at any given time,
+        which helps when evaluating fields of long transient studies.
+
+        Arguments `expression`, `unit`, `dataset`, `outer`, `kind`,
+        `selection`, `refine`, and `smooth` are the same as for `evaluate()`.
+        """
+        if not isinstance(chunk, (int, integer)) or isinstance(chunk, bool):
+            error = 'Argument "chunk" must be an integer.'
+            log.error(error)
+            raise TypeError(error)
+        if chunk < 1:
+            error = 'Argument "chunk" must be at least 1.'
+            log.error(error)
+            raise ValueError(error)
+        (dataset, _, solution) = self.lookup(dataset)
+        info = solution.java.getSolutioninfo()
+        indices = convert(info.getSolnum(1 if outer is None else outer, True))
+        with self.pool:
+            for start in range(0, len(indices), chunk):
+                yield self.evaluate(
+                    expression, unit, dataset,
+                    inner     = indices[start:start+chunk],
+                    outer     = outer,
+                    kind      = kind,
+                    selection = selection,
+                    refine    = refine,
+                    smooth    = smooth,
+                )
+
+    def coordinates(self,
+        dataset: str | Node    = None,
+        outer:   int | integer = None,
+    ) -> NDArray[float64]:
+        """
+        Returns the coordinates of the points that fields are evaluated at.
+
+        The coordinates are those of the mesh nodes of the given `dataset`,
+        or the default dataset, as they would be returned by evaluating the
+        spatial coordinates for the first inner solution and the given
+        `outer` solution. The coordinate names are taken from the spatial
+        frame of the dataset's component. They are usually `'x'`, `'y'`, and,
+        in 3D, `'z'`, but `'r'` and `'z'` in axisymmetric models. The
+        coordinates are returned as an array of shape `(d, N)`, for `d`
+        spatial dimensions and `N` points, in the model's default length unit.
+
+        The coordinates are cached until the model is changed, such as by
+        remeshing or solving it. The returned array is read-only. Subsequent
+        field evaluations that include any of the coordinates without a
+        `unit`, on the same dataset and first inner solution, return the
+        same arrays rather than copies.
+        """
+        (dataset, _, _) = self.lookup(dataset)
+        key = ('coordinates', dataset.path, freeze(outer))
+        coordinates = self.handles.memo.get(key)
+        if coordinates is not None:
+            return coordinates
+        results = self.evaluate(
+            self.axes(dataset), dataset=dataset, inner='first', outer=outer,
+            kind='field',
+        )
+        coordinates = stack([result.reshape(-1) for result in results])
+        coordinates.flags.writeable = False
+        self.handles.memo[key] = coordinates
+        return coordinates
+
+    def probe(self,
+        points:  ArrayLike,
+        dataset: str | Node = None,
+    ) -> Probe:
+        """
+        Returns a [`Probe`](#Probe) for evaluating fields at fixed points.
+
+        The `points` are given as an array of shape `(N, d)` holding the
+        coordinates of `N` points in `d` spatial dimensions, in the model's
+        default length unit. A cut-point dataset is created for them in the
+        model, which refers to the given `dataset`, or the default dataset.
+        """
+        points = locations(points)
+        (dataset, _, _) = self.lookup(dataset)
+        dimension = points.shape[1]
+        # Work with the Java layer directly, as probes don't change the model
+        # in ways that would affect other results, so what has been cached
+        # about the model remains valid.
+        datasets = (self/'datasets').java
+        tag = str(datasets.uniquetag('cpt'))
+        java = datasets.create(tag, f'CutPoint{dimension}D')
+        name = f'MPh probe {tag}'
+        java.label(name)
+        java.set('data', dataset.tag())
+        names = ('pointx', 'pointy', 'pointz')[:dimension]
+        for (axis, property) in enumerate(names):
+            java.set(property, cast(points[:, axis]))
+        log.debug(f'Created probe "{name}" for {len(points)} points.')
+        return Probe(self, self/'datasets'/name, tag, points)
+
+    @pooled
+    def grid(self,
+        expression: str | list[str],
+        bounds:     ArrayLike,
+        shape:      int | tuple[int, ...],
+        unit:       str | list[str]                = None,
+        dataset:    str | Node                     = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        outer:      int | integer                  = None,
+        chunk:      int                            = None,
+    ) -> NDArray[float64] | list[NDArray[float64]]:
+        """
+        Evaluates an expression on a regular grid of points.
+
+        The grid spans the given `bounds`, a sequence of `(min, max)` pairs
+        for each spatial dimension in the model's default length unit, with
+        the number of points along each axis given by `shape`. The results
+        are returned as an array of that same shape, with NaN (not a number)
+        for points outside the geometry. If several inner solutions are
+        evaluated, the array has an additional trailing axis running over
+        them. Several expressions result in a list of such arrays.
+
+        Arguments `expression`, `unit`, `dataset`, `inner`, and `outer` are
+        the same as for [`evaluate()`](#evaluate). For very fine grids, the
+        number of grid slices along the first axis that are evaluated at a
+        time may be limited by specifying a `chunk` size.
+        """
+        bounds = asarray(bounds, dtype=float64)
+        if bounds.ndim == 1:
+            bounds = bounds.reshape(1, -1)
+        if isinstance(shape, (int, integer)):
+            shape = (int(shape),)
+        shape = tuple(int(size) for size in shape)
+        if bounds.ndim != 2 or bounds.shape[1] != 2:
+            error = 'Bounds must be given as (min, max) per dimension.'
+            log.error(error)
+            raise ValueError(error)
+        if len(shape) != len(bounds) or any(size < 1 for size in shape):
+            error = 'Grid shape must have one positive size per dimension.'
+            log.error(error)
+            raise ValueError(error)
+        if chunk is None:
+            chunk = shape[0]
+        if chunk < 1:
+            error = 'Argument "chunk" must be at least 1.'
+            log.error(error)
+            raise ValueError(error)
+        axes = [linspace(lower, upper, size)
+                for ((lower, upper), size) in zip(bounds, shape, strict=True)]
+        multiple = isinstance(expression, (list, tuple))
+
+        # Evaluate slice by slice along the first axis, moving a probe.
+        probe = None
+        outputs = []
+        try:
+            for start in range(0, shape[0], chunk):
+                stop = min(start + chunk, shape[0])
+                grids = meshgrid(axes[0][start:stop], *axes[1:], indexing='ij')
+                points = stack([grid.reshape(-1) for grid in grids], axis=1)
+                if probe is None:
+                    probe = self.probe(points, dataset)
+                else:
+                    probe.move(points)
+                results = probe.evaluate(
+                    expression, unit, inner, outer, kind='field',
+                )
+                if not multiple:
+                    results = [results]
+                for (n, result) in enumerate(results):
+                    block = result.reshape(
+                        (stop - start, *shape[1:], *result.shape[1:])
+                    )
+                    if start == 0:
+                        outputs.append(
+                            empty((*shape, *block.shape[len(shape):]),
+                                  dtype=block.dtype)
+                        )
+                    outputs[n][start:stop] = block
+        finally:
+            if probe is not None:
+                probe.remove()
+        return outputs if multiple else outputs[0]
+
+    @pooled
+    def reduce(self,
+        expression: str | list[str],
+        operation:  Literal['integral', 'average', 'maximum', 'minimum'],
+        selection:  str | Node                     = None,
+        unit:       str | list[str]                = None,
+        dataset:    str | Node                     = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        outer:      int | integer                  = None,
+    ) -> NDArray[float64] | list[NDArray[float64]]:
+        """
+        Integrates, averages, or finds extrema of an expression.
+
+        The `operation` is either `'integral'`, `'average'`, `'maximum'`, or
+        `'minimum'`. It is performed over the given `selection`, the name of
+        a selection node or the node itself, and over the entire geometry if
+        none is given. The computation happens entirely in Comsol, by way of
+        the corresponding derived-value feature, such as `'IntSurface'` for
+        integrals over the domains of a 2D geometry. Only the results, one
+        scalar per solution, are transferred.
+
+        Arguments `expression`, `unit`, `dataset`, `inner`, and `outer` are
+        the same as for [`evaluate()`](#evaluate), and results are returned
+        likewise.
+        """
+        operations = {
+            'integral': 'Int',
+            'average':  'Av',
+            'maximum':  'Max',
+            'minimum':  'Min',
+        }
+        if operation not in operations:
+            error = ('Operation must be either "integral", "average", '
+                     '"maximum", or "minimum".')
+            log.error(error)
+            raise ValueError(error)
+
+        # Determine the dimension of the entities to reduce over.
+        (dataset, _, solution) = self.lookup(dataset)
+        if selection is None:
+            dimension = self.dimension(dataset)
+            tag = None
+        else:
+            if isinstance(selection, str):
+                selection = self/'selections'/selection
+            if not isinstance(selection, Node):
+                error = 'Selection must be a selection name or node.'
+                log.error(error)
+                raise TypeError(error)
+            if not selection.exists():
+                error = f'Selection "{selection.name()}" does not exist.'
+                log.error(error)
+                raise ValueError(error)
+            dimension = int(selection.java.dimension())
+            tag = selection.tag()
+        if dimension == 0:
+            error = ('Cannot reduce over points. Evaluate the expression on '
+                     'a cut-point dataset instead.')
+            log.error(error)
+            raise ValueError(error)
+        entity = ('Line', 'Surface', 'Volume')[dimension-1]
+        type = operations[operation] + entity
+
+        # Set up the derived-value feature.
+        if solution.java.isEmpty():
+            error = 'The solution has not been computed.'
+            log.error(error)
+            raise RuntimeError(error)
+        # Arrays would be compared element-wise with "first" and "last".
+        if isinstance(inner, ndarray):
+            inner = inner.tolist()
+        if inner in ('first', 'last'):
+            (innerinput, solnum) = (inner, None)
+        elif inner is not None:
+            (innerinput, solnum) = ('manual', inner)
+        else:
+            (innerinput, solnum) = (None, None)
+        evaluator = self.pool.get(self, type, dataset)
+        evaluator.select(tag)
+        java = evaluator.configure(
+            expr        = expression,
+            unit        = unit or None,
+            data        = dataset.tag(),
+            outersolnum = outer,
+            innerinput  = innerinput,
+            solnum      = solnum,
+        )
+
+        # Compute the results, one row per solution.
+        log.info(f'Computing {operation} of "{expression}".')
+        results = convert(java.computeResult())
+        if java.isComplex():
+            results = results[0].astype('complex') + 1j*results[1]
+        else:
+            results = results[0]
+        log.info(f'Finished computing {operation}.')
+        if isinstance(expression, (list, tuple)):
+            return [results[:, n].squeeze() for n in range(len(expression))]
+        return results[:, 0].squeeze()
+
+    def follow(self,
+        expression: str | list[str],
+        dataset:    str | Node      = None,
+        unit:       str | list[str] = None,
+        outer:      int | integer   = None,
+    ) -> Follower:
+        """
+        Returns a [`Follower`](#Follower) that reads results as they come in.
+
+        This is useful for monitoring a time-dependent solution in the given
+        `dataset`, or the default one, while it is being extended. Each time
+        the follower is polled, it evaluates the `expression` only for the
+        inner solutions added in the meantime, as reported by
+        [`inner()`](#inner).
+        """
+        (dataset, _, _) = self.lookup(dataset)
+        return Follower(self, expression, unit, dataset, outer)
+
+    # Replaces results for the spatial coordinates with views of the cached
+    # coordinates of the dataset, if any, so that they share memory.
+    def share(self,
+        expression: str | list[str],
+        unit:       str | list[str] | None,
+        dataset:    Node,
+        outer:      int | integer | None,
+        results:    NDArray | list[NDArray],
+    ) -> NDArray | list[NDArray]:
+        key = ('coordinates', dataset.path, freeze(outer))
+        coordinates = self.handles.memo.get(key)
+        if coordinates is None:
+            return results
+        multiple = isinstance(expression, (list, tuple))
+        names = list(expression) if multiple else [expression]
+        axes = self.axes(dataset)
+        if isinstance(unit, (list, tuple)):
+            units = list(unit)
+        else:
+            units = [unit] * len(names)
+        shared = list(results) if isinstance(results, list) else [results]
+        for (n, (name, part)) in enumerate(zip(names, units, strict=True)):
+            if part or name not in axes:
+                continue
+            axis = axes.index(name)
+            if shared[n].shape == coordinates[axis].shape:
+                shared[n] = coordinates[axis]
+        return shared if multiple else shared[0]
+
+    # Writes the results of an evaluation to the `out` file or array, as
+    # documented for `evaluate()`. Each inner solution is evaluated on its
+    # own, so that at most one of them is held in memory at a time.
+    def write(self,
+        out:        str | Path | ndarray,
+        expression: str | list[str],
+        unit:       str | list[str] | None,
+        dataset:    Node,
+        solution:   Node,
+        inner:      str | list[int] | NDArray[integer] | None,
+        outer:      int | integer | None,
+        kind:       Literal['global', 'field', 'particle'] | None,
+        options:    dict[str, Any],
+    ) -> ndarray | Path:
+        if not isinstance(out, (str, Path, ndarray)):
+            error = 'Argument "out" must be a file path or a NumPy array.'
+            log.error(error)
+            raise TypeError(error)
+        if isinstance(out, (str, Path)):
+            out = Path(out)
+            if out.suffix not in ('.npy', '.h5', '.hdf5'):
+                error = f'Cannot write results to "{out.suffix}" files.'
+                log.error(error)
+                raise ValueError(error)
+
+        # Determine which inner solutions to evaluate.
+        info = solution.java.getSolutioninfo()
+        indices = convert(info.getSolnum(1 if outer is None else outer, True))
+        if inner == 'first':
+            indices = indices[:1]
+        elif inner == 'last':
+            indices = indices[-1:]
+        elif inner is not None:
+            indices = array(inner)
+        if not len(indices):
+            error = 'There are no inner solutions to evaluate.'
+            log.error(error)
+            raise ValueError(error)
+
+        # Evaluate one inner solution at a time, and allocate the output
+        # arrays once the shape of the results is known.
+        multiple = isinstance(expression, (list, tuple))
+        names = list(expression) if multiple else [expression]
+        file = None
+        try:
+            for (n, index) in enumerate(indices):
+                results = self.evaluate(
+                    expression, unit, dataset, [int(index)], outer, kind,
+                    **options,
+                )
+                if not multiple:
+                    results = [results]
+                if n == 0:
+                    shape = (len(indices), *results[0].shape)
+                    if multiple:
+                        shape = (len(names), *shape)
+                    if any(result.dtype.kind == 'c' for result in results):
+                        dtype = 'complex'
+                    else:
+                        dtype = float64
+                    if isinstance(out, ndarray):
+                        if out.shape != shape:
+                            error = (f'Array "out" has shape {out.shape}, '
+                                     f'but results have shape {shape}.')
+                            log.error(error)
+                            raise ValueError(error)
+                        target = out
+                    elif out.suffix == '.npy':
+                        target = open_memmap(
+                            out, mode='w+', dtype=dtype, shape=shape
+                        )
+                    else:
+                        file = hdf5(out)
+                        target = file.create_dataset(
+                            'results', shape=shape, dtype=dtype
+                        )
+                        target.attrs['expressions'] = names
+                if multiple:
+                    for (m, result) in enumerate(results):
+                        target[m, n] = result
+                else:
+                    target[n] = results[0]
+        finally:
+            if file is not None:
+                file.close()
+        log.info('Finished writing results.')
+
+        if isinstance(out, ndarray):
+            if hasattr(out, 'flush'):
+                out.flush()
+            return out
+        if out.suffix == '.npy':
+            target.flush()
+            return target
+        return out
 
     ###############
     # Interaction #
@@ -629,6 +1632,7 @@ class Model:
     def rename(self, name: str):
         """Assigns a new name to the model."""
         self.java.label(name)
+        self.state.renamed += 1
 
     @overload
     def parameter(self,
@@ -692,6 +1696,7 @@ class Model:
             if isinstance(value, complex):
                 value = str(value)
             self.java.param().set(name, value)
+            self.handles.changed()
 
     @overload
     def parameters(self,
@@ -800,6 +1805,20 @@ class Model:
         """Removes the node from the model tree."""
         (self/node).remove()
 
+    def refresh(self, node: Node | str = None):
+        """
+        Discards cached references to nodes in the model tree.
+
+        Node references are cached when first resolved and kept up to date
+        as long as the model is modified via this library. Call this method
+        after changing the model tree via the Java layer directly. If a `node`
+        is given, only that branch of the model tree is refreshed.
+        """
+        if node is None:
+            self.handles.invalidate()
+        else:
+            self.handles.invalidate((self/node).path)
+
     #########
     # Files #
     #########
@@ -893,6 +1912,8 @@ class Model:
         for mesh in self/'meshes':
             mesh.java.clearMesh()
         log.info('Finished clearing meshes.')
+        self.handles.changed()
+        self.footprint = 0
 
     def reset(self):
         """Resets the modeling history."""
@@ -919,6 +1940,9 @@ class Model:
         files.
         """
 
+        # Do not save the evaluation features kept for a batch.
+        self.pool.remove()
+
         # Coerce paths given as string to Path objects.
         if path:
             path = Path(path)
@@ -985,3 +2009,659 @@ class Model:
             else:
                 self.java.save(str(file), type)
         log.info('Finished saving model.')
+
+        # Remember the state of the file, so that the client can tell that
+        # the model in memory is the same as on disk.
+        if format == 'Comsol':
+            file = file.resolve()
+            status = file.stat()
+            self.state.saved = (file, status.st_mtime_ns, status.st_size)
+            self.state.version = self.handles.version
+
+
+############
+# Deferred #
+############
+
+class Deferred:
+    """
+    Result of an evaluation that is only performed when needed.
+
+    Instances of this class are returned by [`Model.evaluate()`](#evaluate)
+    when passing `lazy=True`. They record the expression, unit, dataset,
+    the selection of inner and outer solutions, and any further evaluation
+    options, such as `selection` or `refine`, but evaluate nothing
+    until indexed or converted to a NumPy array. The dataset and its
+    solution have already been looked up at that point.
+
+    The first index selects among the inner solutions, such as time steps,
+    and only those are then evaluated. The result is the same as what
+    `evaluate()` returns when passing them as `inner`, with any further
+    indices applied to it. That is, `deferred[10:20]` evaluates only ten
+    inner solutions and `deferred[-1, :5]` returns the results at the first
+    five mesh points for the last one. Use `numpy.asarray(deferred)` to
+    evaluate all selected inner solutions.
+    """
+
+    def __init__(self,
+        model:      Model,
+        expression: str,
+        unit:       str | list[str] | None,
+        dataset:    Node,
+        indices:    NDArray[integer],
+        outer:      int | integer | None,
+        kind:       Literal['global', 'field', 'particle'] | None,
+        options:    dict[str, Any] = None,
+    ):
+        self.model      = model
+        self.expression = expression
+        self.unit       = unit
+        self.dataset    = dataset
+        self.indices    = indices
+        self.outer      = outer
+        self.kind: Literal['global', 'field', 'particle'] | None = kind
+        self.options    = options or {}
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}('{self.expression}', "
+                f"dataset='{self.dataset.name()}', "
+                f'inner={len(self.indices)})')
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, index: Any) -> NDArray:
+        if isinstance(index, tuple):
+            (index, rest) = (index[0], index[1:])
+        else:
+            rest = ()
+        selected = self.indices[index]
+        if isinstance(selected, ndarray):
+            if not len(selected):
+                return array([])
+            results = self.evaluate(selected)
+        else:
+            results = self.evaluate(array([selected]))
+        return results[rest] if rest else results
+
+    def __array__(self, dtype: Any = None, copy: bool = None) -> NDArray:
+        results = self.evaluate(self.indices)
+        return results if dtype is None else results.astype(dtype)
+
+    def evaluate(self, indices: NDArray[integer]) -> NDArray:
+        """Evaluates the given inner solutions."""
+        return self.model.evaluate(
+            self.expression, self.unit, self.dataset,
+            inner = indices.tolist(),
+            outer = self.outer,
+            kind  = self.kind,
+            **self.options,
+        )
+
+
+############
+# Follower #
+############
+
+class Follower:
+    """
+    Reads the results of a time-dependent solution as it grows.
+
+    Instances of this class are returned by [`Model.follow()`](#follow).
+    Each call of [`poll()`](#Follower.poll) evaluates the expression only
+    for those inner solutions, such as time steps, that were added since the
+    previous call.
+    """
+
+    def __init__(self,
+        model:      Model,
+        expression: str | list[str],
+        unit:       str | list[str] | None,
+        dataset:    Node,
+        outer:      int | integer | None,
+    ):
+        self.model      = model
+        self.expression = expression
+        self.unit       = unit
+        self.dataset    = dataset
+        self.outer      = outer
+        self.last       = 0
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}('{self.expression}', "
+                f"dataset='{self.dataset.name()}', last={self.last})")
+
+    def poll(self) -> tuple[
+        NDArray[int32],
+        NDArray[float64],
+        NDArray[float64] | list[NDArray[float64]],
+    ]:
+        """
+        Returns the results of inner solutions added since the last poll.
+
+        Returns a tuple of the new inner solution indices, their values, such
+        as the time, and the results, which have the new inner solutions
+        along the first axis. The arrays are empty if there is nothing new.
+        If the solution has fewer inner solutions than were already read,
+        presumably because the study was run anew, it is read from the start.
+        """
+        (indices, values) = self.model.inner(self.dataset)
+        if len(indices) and indices.max() < self.last:
+            log.debug('Solution has shrunk. Reading from the start.')
+            self.last = 0
+        new = (indices > self.last)
+        (indices, values) = (indices[new], values[new])
+        if not len(indices):
+            if isinstance(self.expression, (list, tuple)):
+                results = [array([]) for expression in self.expression]
+                return (indices, values, results)
+            return (indices, values, array([]))
+        results = self.model.evaluate(
+            self.expression, self.unit, self.dataset,
+            inner = indices.tolist(),
+            outer = self.outer,
+        )
+        if len(indices) == 1:
+            if isinstance(results, list):
+                results = [result[None, ...] for result in results]
+            else:
+                results = results[None, ...]
+        self.last = int(indices.max())
+        return (indices, values, results)
+
+    def reset(self):
+        """Starts reading from the first inner solution again."""
+        self.last = 0
+
+
+#########
+# Probe #
+#########
+
+class Probe:
+    """
+    Evaluates fields at a fixed set of points.
+
+    Instances of this class are returned by [`Model.probe()`](#probe). Each
+    holds a cut-point dataset in the model, which Comsol uses to locate the
+    points in the mesh. The dataset stays in place until the probe is
+    [removed](#Probe.remove), so that repeated evaluations, for example after
+    each solve of a parameter sweep, reuse it.
+    """
+
+    def __init__(self,
+        model:   Model,
+        dataset: Node,
+        tag:     str,
+        points:  NDArray[float64],
+    ):
+        self.model   = model
+        self.dataset = dataset
+        self.tag     = tag
+        self.points  = points
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}('{self.dataset.name()}', "
+                f'points={len(self.points)})')
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def evaluate(self,
+        expression: str | list[str],
+        unit:       str | list[str]                = None,
+        inner:      Literal['first', 'last']
+                    | list[int] | NDArray[integer] = None,
+        outer:      int | integer                  = None,
+        kind:       Literal['global', 'field', 'particle'] = None,
+    ) -> NDArray[float64] | list[NDArray[float64]]:
+        """
+        Evaluates an expression at the probe's points.
+
+        Arguments are the same as for [`Model.evaluate()`](#evaluate), and so
+        are the results, except that the points run along the first axis.
+        That is, the results have shape `(N,)` for `N` points and a single
+        inner solution, or `(N, M)` for `M` inner solutions.
+        """
+        results = self.model.evaluate(
+            expression, unit, self.dataset, inner, outer, kind=kind,
+        )
+        if isinstance(results, list):
+            return [self.arrange(result) for result in results]
+        return self.arrange(results)
+
+    # Puts the points along the first axis of the results, which have been
+    # squeezed by `Model.evaluate()`, so inner solutions may come first, or
+    # the point axis may be gone if there is just one point.
+    def arrange(self, results: NDArray) -> NDArray:
+        results = asarray(results).reshape(-1, len(self.points)).T
+        if results.shape[1] == 1:
+            results = results[:, 0]
+        return results
+
+    def move(self, points: ArrayLike):
+        """Moves the probe to a new set of points of the same dimension."""
+        points = locations(points)
+        if points.shape[1] != self.points.shape[1]:
+            error = (f'Points must have {self.points.shape[1]} coordinates, '
+                     f'not {points.shape[1]}.')
+            log.error(error)
+            raise ValueError(error)
+        java = self.dataset.java
+        names = ('pointx', 'pointy', 'pointz')[:points.shape[1]]
+        for (axis, name) in enumerate(names):
+            java.set(name, cast(points[:, axis]))
+        self.points = points
+        self.forget()
+
+    def remove(self):
+        """Removes the probe's dataset, and features evaluating it."""
+        if not self.dataset.exists():
+            return
+        model = self.model
+        model.pool.discard(model, self.tag)
+        (model/'datasets').java.remove(self.tag)
+        model.handles.discard(self.dataset.path)
+        self.forget()
+
+    # Discards what the model has cached about the probe's dataset, as its
+    # points have changed or it is gone altogether.
+    def forget(self):
+        memo = self.model.handles.memo
+        path = self.dataset.path
+        for key in [key for key in memo if path in key or self.tag in key]:
+            del memo[key]
+        self.model.results.discard(str(self.dataset))
+
+
+def locations(points: ArrayLike) -> NDArray[float64]:
+    """Validates point coordinates and returns them as an `(N, d)` array."""
+    points = asarray(points, dtype=float64)
+    if points.ndim == 1:
+        points = points.reshape(1, -1)
+    if points.ndim != 2 or not 1 <= points.shape[1] <= 3 or not len(points):
+        error = 'Points must be given as an (N, d) array, with d from 1 to 3.'
+        log.error(error)
+        raise ValueError(error)
+    return points
+
+
+###########
+# Results #
+###########
+
+def hdf5(path: Path) -> Any:
+    """Creates an HDF5 file, provided the h5py library is installed."""
+    try:
+        import h5py
+    except ImportError:
+        error = 'Writing HDF5 files requires the h5py library.'
+        log.error(error)
+        raise RuntimeError(error) from None
+    return h5py.File(path, 'w')
+
+
+def gather(results: list[NDArray]) -> NDArray:
+    """Stacks results along a new leading axis, or lists them if ragged."""
+    if not results:
+        return array([])
+    if all(result.shape == results[0].shape for result in results):
+        return stack(results)
+    gathered = empty(len(results), dtype=object)
+    for (index, result) in enumerate(results):
+        gathered[index] = result
+    return gathered
+
+
+class Results:
+    """
+    Caches the results of evaluations within a memory budget.
+
+    Results are indexed by a key that combines all arguments of the
+    evaluation with the `version` of the model's handle cache, which is
+    incremented whenever the model changes in ways that may affect the
+    results. The least recently used entries are discarded once the total
+    size of the cached arrays exceeds the budget. A budget of 0 disables the
+    cache.
+    """
+
+    def __init__(self):
+        self.entries: OrderedDict[
+            tuple[Any, ...],
+            NDArray | list[NDArray],
+        ] = OrderedDict()
+        self.budget = 0
+        self.bytes  = 0
+        self.hits   = 0
+        self.misses = 0
+        self.file: Path | None = None
+        self.origin = ''
+
+    def key(self,
+        version:    int,
+        expression: str | list[str],
+        unit:       str | list[str] | None,
+        dataset:    Node,
+        inner:      str | list[int] | NDArray[integer] | None,
+        outer:      int | integer | None,
+        selection:  str | list[int] | NDArray[integer] | None = None,
+        refine:     int | str | None = None,
+        smooth:     str | None = None,
+    ) -> tuple[Any, ...]:
+        """Returns the cache key for the given evaluation."""
+        return (
+            version, freeze(expression), freeze(unit), str(dataset),
+            freeze(inner), freeze(outer), freeze(selection), freeze(refine),
+            smooth,
+        )
+
+    def get(self, key: tuple[Any, ...]) -> NDArray | list[NDArray] | None:
+        """Returns a copy of the cached results, or `None` if not cached."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return copy(value)
+
+    def put(self,
+        key:   tuple[Any, ...] | None,
+        value: NDArray | list[NDArray],
+    ) -> NDArray | list[NDArray]:
+        """Stores a copy of the results, unless `key` is `None`."""
+        if key is None:
+            return value
+        size = nbytes(value)
+        if size > self.budget:
+            return value
+        if key in self.entries:
+            self.bytes -= nbytes(self.entries.pop(key))
+        self.entries[key] = copy(value)
+        self.bytes += size
+        self.resize(self.budget)
+        return value
+
+    def discard(self, dataset: str):
+        """Discards all entries for the given dataset."""
+        for key in [key for key in self.entries if key[3] == dataset]:
+            self.bytes -= nbytes(self.entries.pop(key))
+
+    def resize(self, budget: int):
+        """Sets the budget and discards entries that exceed it."""
+        self.budget = budget
+        while self.bytes > budget:
+            value = self.entries.popitem(last=False)[1]
+            self.bytes -= nbytes(value)
+
+    def save(self, file: Path):
+        """Saves the entries that the model file reproduces to `file`."""
+        if not self.origin:
+            return
+        arrays: dict[str, Any] = {}
+        keys = []
+        for (key, value) in self.entries.items():
+            values = value if isinstance(value, list) else [value]
+            if key[0] != 0 or any(item.dtype.hasobject for item in values):
+                continue
+            index = len(keys)
+            keys.append(repr((*key, isinstance(value, list))))
+            for (n, item) in enumerate(values):
+                arrays[f'{index}.{n}'] = item
+        with file.open('wb') as stream:
+            savez(
+                stream,
+                origin = array(self.origin),
+                keys   = array(keys, dtype=str),
+                **arrays,
+            )
+        log.debug(f'Saved {len(keys)} cached results to "{file}".')
+
+    def load(self, file: Path):
+        """Loads the entries from `file` if they match the model file."""
+        with load(file, allow_pickle=False) as archive:
+            if str(archive['origin']) != self.origin:
+                log.debug(f'Cached results in "{file}" are out of date.')
+                return
+            for (index, text) in enumerate(archive['keys']):
+                (*key, multiple) = literal_eval(str(text))
+                values = []
+                while f'{index}.{len(values)}' in archive:
+                    values.append(archive[f'{index}.{len(values)}'])
+                self.put(tuple(key), values if multiple else values[0])
+        log.debug(f'Loaded cached results from "{file}".')
+
+    def clear(self):
+        """Discards all entries."""
+        self.entries.clear()
+        self.bytes = 0
+
+    def statistics(self) -> dict[str, int]:
+        """Returns the number of cached results, bytes, hits, and misses."""
+        return {
+            'size':   len(self.entries),
+            'bytes':  self.bytes,
+            'hits':   self.hits,
+            'misses': self.misses,
+        }
+
+
+def freeze(value: Any) -> Any:
+    """Converts evaluation arguments to hashable values."""
+    if isinstance(value, ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, integer):
+        return int(value)
+    return value
+
+
+def nbytes(value: NDArray | list[NDArray]) -> int:
+    """Returns the size of the results in bytes."""
+    if isinstance(value, list):
+        return sum(item.nbytes for item in value)
+    return value.nbytes
+
+
+def copy(value: NDArray | list[NDArray]) -> NDArray | list[NDArray]:
+    """Returns a copy of the results."""
+    if isinstance(value, list):
+        return [item.copy() for item in value]
+    return value.copy()
+
+
+##############
+# Evaluators #
+##############
+
+class Evaluator:
+    """
+    Wraps a numerical evaluation feature so that it can be reused.
+
+    Property values are only sent to Comsol if they differ from what was set
+    previously. Properties passed as `None` to `configure()` are restored to
+    the default values the feature had right after it was created.
+    """
+
+    def __init__(self, node: Node):
+        self.node = node
+        self.java = node.java
+        self.defaults: dict[str, Any] = {}
+        self.values:   dict[str, str] = {}
+        self.selected: str | tuple[int, tuple[int, ...]] | None = ''
+
+    def configure(self, **properties: Any) -> JClass:
+        """Sets the given properties and returns the Java feature object."""
+        for (name, value) in properties.items():
+            if value is None:
+                if name in self.values:
+                    default = self.defaults[name]
+                    value = cast(default) if default is not None else ''
+                    self.java.set(name, value)
+                    del self.values[name]
+                continue
+            fingerprint = (
+                f'{value.dtype}{value.tolist()}'
+                if isinstance(value, ndarray) else repr(value)
+            )
+            if self.values.get(name) == fingerprint:
+                continue
+            if name not in self.defaults:
+                self.defaults[name] = get(self.java, name)
+            self.java.set(name, cast(value))
+            self.values[name] = fingerprint
+        return self.java
+
+    def select(self,
+        entity:    str | NDArray[integer] | None,
+        dimension: int = None,
+    ) -> JClass:
+        """
+        Selects a named selection or entities, or everything if `None`.
+
+        A string `entity` is the tag of a named selection. An array holds the
+        numbers of the entities of the given `dimension`.
+        """
+        if isinstance(entity, ndarray):
+            fingerprint = (dimension, tuple(entity.tolist()))
+        else:
+            fingerprint = entity
+        if fingerprint != self.selected:
+            java = self.java.selection()
+            if entity is None:
+                java.all()
+            elif isinstance(entity, str):
+                java.named(entity)
+            else:
+                java.geom(dimension)
+                java.set(cast(entity))
+            self.selected = fingerprint
+        return self.java
+
+
+class EvaluationPool:
+    """
+    Keeps numerical evaluation features around for reuse.
+
+    There is one feature per type of evaluation, such as `'EvalGlobal'`, and
+    dataset. Features are created in the model's `evaluations` group when
+    first needed. The pool is a context manager that can be entered several
+    times, and the features are removed again when the outermost context is
+    left, or via `remove()`. Neither counts as a change of the model, so what
+    the model's handle cache has memoized is kept.
+    """
+
+    def __init__(self):
+        self.evaluators: dict[tuple[str, str | None], Evaluator] = {}
+        self.depth  = 0
+        self.hits   = 0
+        self.misses = 0
+
+    def __enter__(self) -> EvaluationPool:
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exception: Any):
+        self.depth -= 1
+        if not self.depth:
+            self.remove()
+
+    def get(self, model: Model, type: str, dataset: Node) -> Evaluator:
+        """Returns the evaluator of the given type for the dataset."""
+        key = (type, dataset.tag())
+        evaluator = self.evaluators.get(key)
+        if evaluator:
+            # The model's node cache is dropped when a study is run, among
+            # other things. So only check the feature still exists if needed.
+            node = evaluator.node
+            if not model.handles.cached(node.path) and not node.exists():
+                evaluator = None
+            else:
+                evaluator.java = node.java
+        if evaluator:
+            self.hits += 1
+            return evaluator
+        self.misses += 1
+        # Create the feature via the Java layer, as adding it to the model
+        # does not change any results, so what has been cached remains valid.
+        (type, tag) = key
+        name = f'MPh {type} {tag}'
+        evaluations = (model/'evaluations').java
+        node = model/'evaluations'/name
+        if node.exists():
+            evaluations.remove(node.tag())
+            model.handles.discard(node.path)
+        java = evaluations.create(evaluations.uniquetag('num'), type)
+        java.label(name)
+        evaluator = Evaluator(node)
+        self.evaluators[key] = evaluator
+        return evaluator
+
+    def discard(self, model: Model, tag: str):
+        """Removes the evaluation features of the dataset with given tag."""
+        evaluations = model/'evaluations'
+        for key in [key for key in self.evaluators if key[1] == tag]:
+            node = self.evaluators.pop(key).node
+            try:
+                evaluations.java.remove(node.tag())
+            except Exception:
+                log.debug(f'Could not remove "{node}".')
+            model.handles.discard(node.path)
+
+    def remove(self):
+        """Removes all evaluation features from the model."""
+        for evaluator in self.evaluators.values():
+            node = evaluator.node
+            try:
+                (node.model/'evaluations').java.remove(node.tag())
+                node.model.handles.discard(node.path)
+            except Exception:
+                log.debug(f'Could not remove "{node}".')
+        self.evaluators.clear()
+
+    def statistics(self) -> dict[str, int]:
+        """Returns the number of pooled features, hits, and misses."""
+        return {
+            'size':   len(self.evaluators),
+            'hits':   self.hits,
+            'misses': self.misses,
+        }
+
+
+#########
+# State #
+#########
+
+class State:
+    """
+    Keeps track of what is known about a model beyond its model tree.
+
+    One instance is shared by all [`Model`](#Model) instances that wrap the
+    same Java model, such as those type-cast from one another, so that what
+    is recorded through one of them applies to all. The `footprint` is the
+    estimated memory taken up by the model's solutions. `saved` holds the
+    file the model was last saved to, if any, and the file's signature. The
+    `solved` hook, if set, is called after the model has been solved via
+    [`Model.solve()`](#solve). `version` is the version of the model's
+    handle cache at the time it was last saved, which tells if there are
+    unsaved changes. `renamed` counts how often the model was renamed via
+    [`Model.rename()`](#rename).
+    """
+
+    def __init__(self):
+        self.footprint = 0
+        self.saved: tuple[Path, int, int] | None = None
+        self.version = 0
+        self.renamed = 0
+        self.solved: Callable[[], Any] | None = None
+
+
+##########
+# Memory #
+##########
+
+def memory() -> int:
+    """Returns the number of bytes in use on the Java VM's heap."""
+    runtime = JClass('java.lang.Runtime').getRuntime()
+    return int(runtime.totalMemory()) - int(runtime.freeMemory())
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 from jpype     import JBoolean, JInt, JDouble, JString, JArray, JClass
-from numpy     import array, ndarray, integer
+from numpy     import array, ndarray, integer, floating
+from numpy     import asarray, ascontiguousarray, empty, stack
+from numpy     import iinfo, float64
 
 from pathlib   import Path
 from re        import split
 from json      import load as json_load
 from difflib   import get_close_matches
 from functools import lru_cache
+from types     import MappingProxyType
 from logging   import getLogger
 
 from typing          import TYPE_CHECKING, overload, Literal, ClassVar
-from collections.abc import Iterator, Sequence
+from typing          import NamedTuple, Any
+from collections.abc import Iterator, Sequence, Mapping
 from numpy.typing    import ArrayLike, NDArray
 from numpy           import int32
 if TYPE_CHECKING:
@@ -207,13 +211,31 @@ class Node:
 
         Note that this is a property, not an attribute. Internally, it is a
         function that performs a top-down search of the model tree in order to
-        resolve the node reference. So it introduces a certain overhead every
-        time it is accessed.
+        resolve the node reference. The resolved Java object is then cached by
+        the model, so that subsequent access is fast. The cache is invalidated
+        when nodes are renamed, retagged, created, or removed via this class.
+        After changing the model tree via the Java layer directly, call
+        [`Model.refresh()`](#Model.refresh) to discard stale entries.
 
         [`ModelNode`]: https://doc.comsol.com/6.4/doc/com.comsol.help.comsol/api/com/comsol/model/ModelNode.html
         """
         if self.is_root():
             return self.model.java
+        handles = self.model.handles
+        java = handles.get(self.path)
+        if java is None:
+            java = self.resolve()
+            if java is not None:
+                handles.store(self.path, java)
+        return java
+
+    def resolve(self) -> JClass | None:
+        # Resolves the node reference by searching the model tree top-down.
+        #
+        # This is what the `java` property falls back to when the node is not
+        # in the model's cache. Only the parent is looked up via that property,
+        # so resolution benefits from cached ancestors. Children are then found
+        # via the parent container's index, mapping their names to tags.
         name = self.name()
         if self.is_group():
             if name in self.groups:
@@ -221,19 +243,30 @@ class Node:
             else:
                 return None
         parent = self.parent()
-        java = parent.java
-        if not java:
+        container = parent.container()
+        if not container:
+            return None
+        tag = self.model.handles.index(parent.path, container).get(name)
+        if tag is None:
             return None
-        if parent.is_group():
-            container = java
+        return container.get(tag)
+
+    def container(self) -> JClass | None:
+        # Returns the Java object that holds the node's children, if any.
+        #
+        # For built-in groups, that is the group's Java object itself. Other
+        # nodes either have property groups, like materials do, or features.
+        java = self.java
+        if self.is_root() or not java:
+            return None
+        if self.is_group():
+            return java
         elif hasattr(java, 'propertyGroup'):
-            container = java.propertyGroup()
+            return java.propertyGroup()
+        elif hasattr(java, 'feature'):
+            return java.feature()
         else:
-            container = java.feature()
-        for tag in container.tags():
-            member = container.get(tag)
-            if name == escape(member.label()):
-                return member
+            return None
 
     def java_if_exists(self) -> JClass:
         # Returns `self.java` if the node exists, raises an error otherwise.
@@ -282,19 +315,13 @@ class Node:
 
     def children(self) -> list[Node]:
         """Returns all child nodes."""
-        java = self.java
         if self.is_root():
             return [self.__class__(self.model, group) for group in self.groups]
-        elif self.is_group():
-            return [self/escape(java.get(tag).label()) for tag in java.tags()]
-        elif hasattr(java, 'propertyGroup'):
-            return [self/escape(java.propertyGroup(tag).label())
-                    for tag in java.propertyGroup().tags()]
-        elif hasattr(java, 'feature'):
-            return [self/escape(java.feature(tag).label())
-                    for tag in java.feature().tags()]
-        else:
+        container = self.container()
+        if not container:
             return []
+        names = self.model.handles.names(self.path, container)
+        return [self/name for name in names]
 
     def is_root(self) -> bool:
         """Checks if the node is the model's root node."""
@@ -365,6 +392,73 @@ class Node:
             items += child.problems()
         return items
 
+    def snapshot(self,
+        properties: bool = False,
+        max_depth:  int  = None,
+    ) -> Snapshot:
+        """
+        Captures the node and its descendants in an immutable snapshot.
+
+        The branch of the model tree is traversed only once, holding on to the
+        Java objects along the way. This is much faster than navigating the
+        tree node by node, especially in client–server mode. Each node is
+        recorded as a [`Snapshot`](#Snapshot) with its name, tag, feature
+        type, active state, and comment. If `properties` is `True`, the node
+        properties are recorded as well, which takes considerably longer.
+        Specify `max_depth` to possibly limit the number of lower branches.
+
+        Snapshots hold no references to Java objects, so they remain valid for
+        offline inspection. They can be displayed with [`mph.tree()`](#tree)
+        or converted to plain data structures that can be serialized as JSON.
+
+        Raises `LookupError` if the node does not exist.
+        """
+        handles = self.model.handles
+
+        def record(node: Node, java: JClass, depth: int) -> Snapshot:
+            values = None
+            if properties and hasattr(java, 'properties'):
+                values = {}
+                for name in sorted(str(name) for name in java.properties()):
+                    try:
+                        values[name] = get(java, name)
+                    except Exception as error:
+                        log.debug(f'Skipping property "{name}": {error}')
+                values = MappingProxyType(values)
+            children = []
+            if not max_depth or depth < max_depth:
+                if node.is_root():
+                    for group in node.groups:
+                        child = node/group
+                        children.append(record(child, child.java, depth+1))
+                else:
+                    container = node.container()
+                    if container:
+                        (tags, names, lookup) = handles.entry(
+                            node.path, container
+                        )
+                        for (tag, name) in zip(tags, names, strict=True):
+                            child = node/name
+                            member = container.get(tag)
+                            if lookup[name] == tag:
+                                handles.store(child.path, member)
+                            children.append(record(child, member, depth+1))
+            return Snapshot(
+                path       = str(node),
+                name       = node.name(),
+                tag        = str(java.tag()) if hasattr(java, 'tag') else None,
+                type       = (str(java.getType())
+                              if hasattr(java, 'getType') else None),
+                active     = (bool(java.isActive())
+                              if hasattr(java, 'isActive') else None),
+                comment    = (str(java.comments())
+                              if hasattr(java, 'comments') else None),
+                properties = values,
+                children   = tuple(children),
+            )
+
+        return record(self, self.java_if_exists(), 0)
+
     ###############
     # Interaction #
     ###############
@@ -382,7 +476,10 @@ class Node:
         java = self.java
         if java:
             java.label(name)
+        handles = self.model.handles
+        handles.invalidate(self.path)
         self.path = (*self.path[:-1], name)
+        handles.invalidate(self.path)
 
     def retag(self, tag: str):
         """Assigns a new tag to the node."""
@@ -396,6 +493,7 @@ class Node:
             raise PermissionError(error)
         java = self.java_if_exists()
         java.tag(tag)
+        self.model.handles.invalidate(self.path)
 
     @overload
     def property(self,
@@ -419,6 +517,7 @@ class Node:
             return get(java, name)
         else:
             java.set(name, cast(value))
+            self.model.handles.changed()
 
     def properties(self) -> dict[
         str,
@@ -493,6 +592,7 @@ class Node:
             error = "Entity must be a node, 'all', or an array of integers."
             log.error(error)
             raise ValueError(error)
+        self.model.handles.changed()
 
     def selection(self) -> Node | NDArray[int32] | None:
         """
@@ -531,7 +631,7 @@ class Node:
             return node
         else:
             entities = java.entities()
-            return array(entities) if entities else None
+            return convert(entities) if entities else None
 
     def toggle(self,
         action: Literal[
@@ -556,6 +656,7 @@ class Node:
             java.active(True)
         elif action in ('disable', 'off', 'deactivate'):
             java.active(False)
+        self.model.handles.changed()
 
     def run(self):
         """Performs the "run" action if the node implements it."""
@@ -564,7 +665,13 @@ class Node:
             error = f'Node "{self}" does not implement "run" operation.'
             log.error(error)
             raise RuntimeError(error)
-        java.run()
+        try:
+            java.run()
+        finally:
+            # Running a study may regenerate solver sequences, datasets, and
+            # plots, so cached references to any of them may now be stale.
+            self.model.handles.invalidate()
+            self.model.handles.changed()
 
     def import_(self, file: Path | str):
         """
@@ -646,6 +753,7 @@ class Node:
         else:
             name = escape(container.get(tag).label())
         child = self/name
+        self.model.handles.invalidate(child.path)
         check = tag_pattern(feature_path(child))
         if pattern != check:
             pattern = check
@@ -673,15 +781,218 @@ class Node:
             error = f'Node "{self}" does not exist in model tree.'
             log.error(error)
             raise LookupError(error)
-        parent = self.parent()
-        java = parent.java
-        if parent.is_group():
-            container = java
-        elif hasattr(java, 'propertyGroup'):
-            container = java.propertyGroup()
-        else:
-            container = java.feature()
+        container = self.parent().container()
         container.remove(self.java.tag())
+        self.model.handles.invalidate(self.path)
+        # Evaluation features, unlike say variables, don't affect results.
+        if self.path[0] != 'evaluations':
+            self.model.handles.changed()
+
+
+############
+# Snapshot #
+############
+
+class Snapshot(NamedTuple):
+    """
+    Immutable record of a model node and its descendants.
+
+    Snapshots are returned by [`Node.snapshot()`](#Node.snapshot) and
+    [`Model.snapshot()`](#Model.snapshot). They capture the state of a
+    branch of the model tree at the time they were taken, without holding
+    references to Java objects.
+    """
+
+    path: str
+    """Path of the node from the model's root."""
+
+    name: str
+    """Name of the node."""
+
+    tag: str | None
+    """Tag of the node, if any."""
+
+    type: str | None
+    """Feature type of the node, if any."""
+
+    active: bool | None
+    """Whether the node is active, if it can be toggled at all."""
+
+    comment: str | None
+    """Comment attached to the node, if supported."""
+
+    properties: Mapping[str, Any] | None
+    """Node properties, unless they were not recorded."""
+
+    children: tuple[Snapshot, ...]
+    """Snapshots of the child nodes."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns the snapshot as nested dictionaries.
+
+        Property values are converted to data types that can be serialized as
+        JSON, i.e. arrays to lists and file-system paths to strings.
+        """
+        values = None
+        if self.properties is not None:
+            values = {
+                name: plain(value) for (name, value) in self.properties.items()
+            }
+        return {
+            'path':       self.path,
+            'name':       self.name,
+            'tag':        self.tag,
+            'type':       self.type,
+            'active':     self.active,
+            'comment':    self.comment,
+            'properties': values,
+            'children':   [child.as_dict() for child in self.children],
+        }
+
+
+def plain(value: Any) -> Any:
+    """Converts a property value to a data type native to JSON."""
+    if isinstance(value, ndarray):
+        if value.dtype.kind == 'O':
+            return [plain(row) for row in value]
+        return value.tolist()
+    elif isinstance(value, (Path, Node)):
+        return str(value)
+    elif isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    elif isinstance(value, integer):
+        return int(value)
+    elif isinstance(value, floating):
+        return float(value)
+    else:
+        return value
+
+
+###########
+# Handles #
+###########
+
+class Handles:
+    """
+    Caches the Java objects that node references resolve to.
+
+    Every [`Model`](#Model) instance holds one such cache, which the `java`
+    property of [`Node`](#Node) consults before searching the model tree. The
+    Java objects are indexed by node path. Entries are only ever added for
+    nodes that exist, so that newly created nodes are found right away.
+
+    The cache also holds an index for each container of child nodes that has
+    been searched. It maps the names of the children to their tags and is
+    rebuilt whenever the container reports a different list of tags.
+
+    Other facts derived from the model tree, such as the default dataset or
+    how an expression is to be evaluated, are memoized in `memo`. They are
+    discarded whenever any part of the cache is invalidated, and when the
+    model is changed in ways that may affect evaluation results, such as by
+    setting node properties. Such changes are counted by `version`.
+    """
+
+    def __init__(self):
+        self.handles: dict[tuple[str, ...], JClass] = {}
+        self.indices: dict[
+            tuple[str, ...],
+            tuple[tuple[str, ...], tuple[str, ...], dict[str, str]],
+        ] = {}
+        self.memo: dict[tuple[Any, ...], Any] = {}
+        self.version  = 0
+        self.hits     = 0
+        self.misses   = 0
+        self.reused   = 0
+        self.rebuilt  = 0
+
+    def get(self, path: tuple[str, ...]) -> JClass | None:
+        """Returns the cached Java object for the given path, if any."""
+        java = self.handles.get(path)
+        if java is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return java
+
+    def cached(self, path: tuple[str, ...]) -> bool:
+        """Checks if the Java object for the given path is cached."""
+        return path in self.handles
+
+    def store(self, path: tuple[str, ...], java: JClass):
+        """Stores the Java object resolved for the given path."""
+        self.handles[path] = java
+
+    def entry(self,
+        path:      tuple[str, ...],
+        container: JClass,
+    ) -> tuple[tuple[str, ...], tuple[str, ...], dict[str, str]]:
+        """Returns the up-to-date index entry of the given container."""
+        tags = tuple(str(tag) for tag in container.tags())
+        entry = self.indices.get(path)
+        if entry and entry[0] == tags:
+            self.reused += 1
+            return entry
+        self.rebuilt += 1
+        names = tuple(escape(container.get(tag).label()) for tag in tags)
+        lookup: dict[str, str] = {}
+        for (name, tag) in zip(names, tags, strict=True):
+            lookup.setdefault(name, tag)
+        entry = (tags, names, lookup)
+        self.indices[path] = entry
+        return entry
+
+    def index(self,
+        path:      tuple[str, ...],
+        container: JClass,
+    ) -> dict[str, str]:
+        """Returns the mapping of child names to tags for the container."""
+        return self.entry(path, container)[2]
+
+    def names(self,
+        path:      tuple[str, ...],
+        container: JClass,
+    ) -> tuple[str, ...]:
+        """Returns the names of the container's children in order."""
+        return self.entry(path, container)[1]
+
+    def changed(self):
+        """Records a change of the model that may affect its results."""
+        self.version += 1
+        self.memo.clear()
+
+    def invalidate(self, path: tuple[str, ...] = None):
+        """Discards entries for the given path and beneath, or all of them."""
+        self.memo.clear()
+        if path is None:
+            self.handles.clear()
+            self.indices.clear()
+            return
+        self.discard(path)
+
+    def discard(self, path: tuple[str, ...]):
+        """Discards entries for the given path and beneath, but not `memo`."""
+        depth = len(path)
+        for key in [key for key in self.handles if key[:depth] == path]:
+            del self.handles[key]
+        for key in [key for key in self.indices if key[:depth] == path]:
+            del self.indices[key]
+        self.indices.pop(path[:-1], None)
+
+    def statistics(self) -> dict[str, dict[str, int]]:
+        """Returns the number of cached entries, hits, and misses."""
+        return {
+            'nodes': {
+                'size':   len(self.handles),
+                'hits':   self.hits,
+                'misses': self.misses,
+            },
+            'containers': {
+                'size':   len(self.indices),
+                'hits':   self.reused,
+                'misses': self.rebuilt,
+            },
+        }
 
 
 ################
@@ -788,6 +1099,9 @@ def cast(
     elif isinstance(value, Path):
         return JString(str(value))
     elif isinstance(value, (list, tuple)):
+        numbers = numeric(value)
+        if numbers is not None:
+            return cast(numbers)
         dimension = 0
         item = value
         while isinstance(item, (list, tuple)):
@@ -803,11 +1117,21 @@ def cast(
         return JArray(datatype, dimension)(value)
     elif isinstance(value, ndarray):
         if value.dtype.kind == 'b':
-            return JArray(JBoolean, value.ndim)(value)
+            if not value.size:
+                return JArray(JBoolean, value.ndim)(value)
+            return JArray.of(ascontiguousarray(value))
         elif value.dtype.kind == 'f':
-            return JArray(JDouble, value.ndim)(value)
-        elif value.dtype.kind == 'i':
-            return JArray(JInt, value.ndim)(value)
+            if not value.size:
+                return JArray(JDouble, value.ndim)(value)
+            return JArray.of(ascontiguousarray(value, dtype=float64))
+        elif value.dtype.kind in 'iu':
+            if not value.size:
+                return JArray(JInt, value.ndim)(value)
+            if not fits_int32(value):
+                error = 'Integer values exceed the range of Java integers.'
+                log.error(error)
+                raise OverflowError(error)
+            return JArray.of(ascontiguousarray(value, dtype=int32))
         elif value.dtype.kind == 'O':
             if value.ndim > 2:
                 error = 'Cannot cast object arrays of dimension higher than 2.'
@@ -817,7 +1141,8 @@ def cast(
                 error = 'Will not cast object arrays with more than two rows.'
                 log.error(error)
                 raise TypeError(error)
-            rows = [row.astype(float) for row in value]
+            rows = [cast(ascontiguousarray(row, dtype=float64))
+                    for row in value]
             return JArray(JDouble, 2)(rows)
         else:
             error = f'Cannot cast arrays of data type "{value.dtype}".'
@@ -829,6 +1154,74 @@ def cast(
         raise TypeError(error)
 
 
+def numeric(value: list | tuple) -> NDArray | None:
+    """
+    Returns (nested) lists of numbers as an array, if they are homogeneous.
+
+    This lets [`cast()`](#cast) convert large numeric lists in bulk, rather
+    than item by item. `None` is returned if the list is empty, ragged, or
+    holds anything other than numbers, as well as for integers out of range
+    for Java, so that those cases are left to the item-wise conversion.
+    """
+    item = value
+    while isinstance(item, (list, tuple)):
+        if not item:
+            return None
+        item = item[0]
+    if not isinstance(item, (bool, int, float, integer, floating)):
+        return None
+    try:
+        numbers = array(value)
+    except (ValueError, TypeError):
+        return None
+    if not numbers.size:
+        return None
+    if numbers.dtype.kind in 'bf':
+        return numbers
+    if numbers.dtype.kind in 'iu' and fits_int32(numbers):
+        return numbers.astype(int32)
+    return None
+
+
+def fits_int32(values: NDArray[integer]) -> bool:
+    """Checks if all integers in the array fit into a Java `int`."""
+    limits = iinfo(int32)
+    return bool(values.min() >= limits.min and values.max() <= limits.max)
+
+
+def convert(value: JArray) -> NDArray:
+    """
+    Converts a Java array of primitive values to a NumPy array.
+
+    Rectangular arrays, of any dimension, are copied in bulk via the buffer
+    protocol that JPype implements for Java arrays of primitive data types.
+    This avoids creating a Python object for each element, which would be
+    slow for large arrays and temporarily multiply the memory footprint.
+
+    Java matrices are arrays of arrays and may therefore be ragged, i.e. have
+    rows of different length. Those cannot be represented as a regular NumPy
+    array and are returned as a one-dimensional object array instead, with
+    each element holding the array of one row.
+    """
+    try:
+        values = asarray(memoryview(value))  # pyright: ignore[reportArgumentType]
+    except (BufferError, TypeError, ValueError):
+        pass
+    else:
+        if not values.flags.writeable:
+            values = values.copy()
+        return values
+    rows = [convert(row) for row in value]
+    if not rows:
+        return array(rows)
+    if len({row.shape for row in rows}) == 1 and rows[0].dtype.kind != 'O':
+        return stack(rows)
+    values = empty(len(rows), dtype=object)
+    for (index, row) in enumerate(rows):
+        values[index] = row
+    return values
+
+
 def get(
     java: JClass,
     name: str,
@@ -843,30 +1236,30 @@ def get(
     if datatype == 'Boolean':
         return java.getBoolean(name)
     elif datatype == 'BooleanArray':
-        return array(java.getBooleanArray(name))
+        return convert(java.getBooleanArray(name))
     elif datatype == 'BooleanMatrix':
-        return array([line for line in java.getBooleanMatrix(name)])
+        return convert(java.getBooleanMatrix(name))
     elif datatype == 'Double':
         return java.getDouble(name)
     elif datatype == 'DoubleArray':
-        return array(java.getDoubleArray(name))
+        return convert(java.getDoubleArray(name))
     elif datatype == 'DoubleMatrix':
-        return array([line for line in java.getDoubleMatrix(name)])
+        return convert(java.getDoubleMatrix(name))
     elif datatype == 'DoubleRowMatrix':
         value = java.getDoubleMatrix(name)
         if len(value) == 0:
             rows = []
         else:
-            rows = [array(row) for row in value]
+            rows = [convert(row) for row in value]
         return array(rows, dtype=object)
     elif datatype == 'File':
         return Path(str(java.getString(name)))
     elif datatype == 'Int':
         return int(java.getInt(name))
     elif datatype == 'IntArray':
-        return array(java.getIntArray(name))
+        return convert(java.getIntArray(name))
     elif datatype == 'IntMatrix':
-        return array([line for line in java.getIntMatrix(name)])
+        return convert(java.getIntMatrix(name))
     elif datatype == 'None':
         return None
     elif datatype == 'Selection':
@@ -892,7 +1285,7 @@ def get(
 # Inspection #
 ##############
 
-def tree(node: Node | Model, max_depth: int = None):
+def tree(node: Node | Model | Snapshot, max_depth: int = None):
     """
     Displays the model tree.
 
@@ -920,28 +1313,33 @@ def tree(node: Node | Model, max_depth: int = None):
 
     Often the node would refer to the model's root in order to inspect the
     entire model tree. A [`Model`](#Model) object is therefore also accepted
-    as a value for `node`.
+    as a value for `node`. So is a [`Snapshot`](#Snapshot) taken earlier.
 
-    Note that this function performs poorly in client–server mode, which is the
-    default way to communicate with the Comsol backend. The client–server
+    Displaying large models in client–server mode, the default way to
+    communicate with the Comsol backend, takes some time, as the client–server
     communication introduces inefficiencies that do not occur in stand-alone
-    mode, where client and backend run in the same process, and the model tree,
-    i.e. the hierarchy of related Java objects, can thus be traversed
-    reasonably fast.
+    mode. Displaying a snapshot involves no communication at all.
     """
 
-    def traverse(node: Node, levels: list[bool], max_depth: int | None):
+    def traverse(
+        node:      Node | Snapshot,
+        levels:    list[bool],
+        max_depth: int | None,
+    ):
         if max_depth and len(levels) > max_depth:
             return
         markers = ''.join('   ' if last else '│  ' for last in levels[:-1])
         markers += '' if not levels else '└─ ' if levels[-1] else '├─ '
-        print(f'{markers}{node.name()}')
-        children = node.children()
+        if isinstance(node, Snapshot):
+            (name, children) = (node.name, node.children)
+        else:
+            (name, children) = (node.name(), node.children())
+        print(f'{markers}{name}')
         last = len(children) - 1
         for (index, child) in enumerate(children):
             traverse(child, [*levels, index == last], max_depth)
 
-    if not isinstance(node, Node):
+    if not isinstance(node, (Node, Snapshot)):
         # Assume node is actually a model object and traverse from root.
         node = node/None
     traverse(node, [], max_depth)
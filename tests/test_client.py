@@ -3,11 +3,14 @@
 import mph
 from mph import Client, Model
 
+from fixtures import temp_dir
 from fixtures import logging_disabled
 from fixtures import setup_logging
 
 from pytest  import raises
 from pathlib import Path
+from shutil  import copyfile
+import os
 from packaging import version
 
 
@@ -20,7 +23,8 @@ demo = Path(__file__).resolve().parent/'demo.mph'
 # we load a model and create another one early on, just so we have something to
 # work with. And `connect()` is already called from `__init__()`, which is why
 # `disconnect()` comes before `connect()`, which actually tests reconnecting
-# the client.
+# the client. Limiting the number of models is tested after clearing them, so
+# as to not evict the ones loaded early on.
 
 def test_init():
     global client
@@ -49,6 +53,30 @@ def test_create():
     assert 'Untitled' in client.names()
 
 
+def test_clone():
+    clone = client.clone(model, name='clone')
+    assert 'clone' in client.names()
+    assert clone != model
+    assert clone.parameters() == model.parameters()
+    client.remove(clone)
+    clone = client.clone(model, clear=True)
+    assert clone.name() == model.name()
+    folder = client.pool.folder
+    assert folder is not None
+    assert folder.is_dir()
+    client.remove(clone)
+    with logging_disabled():
+        with raises(TypeError):
+            client.clone('demo')          # pyright: ignore[reportArgumentType]
+        with raises(ValueError):
+            client.clone(client/'empty')
+    assert not model.modified()
+    model.parameter('U', model.parameter('U'))
+    assert model.modified()
+    with logging_disabled(), raises(ValueError):
+        client.clone(model)
+
+
 def test_repr():
     assert repr(client) == f"Client(port={client.port}, host='localhost')"
 
@@ -67,6 +95,12 @@ def test_iter():
 
 def test_truediv():
     assert client/'demo' == model
+    assert client/'demo' is model
+    model.rename('renamed')
+    assert client/'renamed' is model
+    assert 'demo' not in client
+    model.rename('demo')
+    assert client/'demo' is model
     with logging_disabled(), raises(ValueError):
         client/'non-existing'         # pyright: ignore[reportUnusedExpression]
 
@@ -77,6 +111,8 @@ def test_cores():
 
 def test_models():
     assert model in client.models()
+    assert any(item is model for item in client.models())
+    assert client.models()[0] is client.models()[0]
 
 
 def test_names():
@@ -87,6 +123,12 @@ def test_files():
     assert demo in client.files()
 
 
+def test_footprints():
+    footprints = client.footprints()
+    assert model.name() in footprints
+    assert all(footprint >= 0 for footprint in footprints.values())
+
+
 def test_modules():
     Comsol62_or_older = (version.parse(client.version) < version.parse('6.3'))
     Comsol64_or_later = (version.parse(client.version) >= version.parse('6.4'))
@@ -100,8 +142,23 @@ def test_modules():
         assert value in mph.model.modules.values()
     assert 'Comsol core' in client.modules()
     mph.client.modules['invalid'] = 'invalid'
-    client.modules()
+    assert 'invalid' not in client.modules()
     del mph.client.modules['invalid']
+    assert client.modules(refresh=True) == client.modules()
+    assert 'COMSOL' in client.products
+    client.products['COMSOL'] = False
+    assert 'Comsol core' not in client.modules()
+    assert 'Comsol core' in client.modules(refresh=True)
+
+
+def test_has():
+    assert client.has('Comsol core')
+    assert client.has('COMSOL')
+    assert client.has('Comsol core', refresh=True)
+    for name in mph.client.modules.values():
+        assert client.has(name) == (name in client.modules())
+    with logging_disabled(), raises(ValueError):
+        client.has('non-existing')
 
 
 def test_caching():
@@ -113,6 +170,32 @@ def test_caching():
     assert client.caching()
     copy = client.load(demo)
     assert model == copy
+    file = temp_dir()/'changed.mph'
+    copyfile(demo, file)
+    first = client.load(file)
+    assert client.load(file) is first
+    count = len(client.models())
+    time = file.stat().st_mtime_ns + 10**9
+    os.utime(file, ns=(time, time))
+    second = client.load(file)
+    assert len(client.models()) == count + 1
+    assert first in client.models()
+    assert second in client.models()
+    mph.Model(second).save()
+    assert second.saved
+    assert client.load(file) is second
+    mph.option('checksum', True)
+    assert client.load(file) is second
+    assert client.load(file) is second
+    mph.option('checksum', False)
+    client.java.remove(second.java.tag())
+    third = client.load(file)
+    assert third is not second
+    client.remove(first)
+    client.remove(third)
+    file.unlink()
+    with logging_disabled(), raises(FileNotFoundError):
+        client.load(file)
     client.caching(False)
     assert not client.caching()
 
@@ -135,8 +218,61 @@ def test_remove():
 
 
 def test_clear():
+    folder = client.pool.folder
+    assert folder is not None
     client.clear()
     assert not client.models()
+    assert not folder.exists()
+
+
+def test_limit():
+    client.limit(count=2)
+    first = client.load(demo)
+    second = client.load(demo)
+    assert first in client.models()
+    assert len(client.footprints()) == 2
+    third = client.load(demo)
+    assert len(client.models()) == 2
+    assert second in client.models()
+    assert third in client.models()
+    assert client.pool.evicted == 1
+    client.limit()
+    for tag in client.pool.loaded:
+        client.pool.loaded[tag] = 0
+    client.pool.models[str(second.java.tag())].footprint = 1000
+    client.limit(budget=500, eviction='clear')
+    assert len(client.models()) == 2
+    assert client.pool.models[str(second.java.tag())].footprint == 0
+    assert client.pool.evicted == 2
+    for tag in client.pool.loaded:
+        client.pool.loaded[tag] = 1000
+    client.limit(budget=1500, eviction='clear')
+    assert len(client.models()) == 1
+    assert third in client.models()
+    assert client.pool.evicted == 3
+    client.limit()
+    fourth = client.load(demo)
+    for tag in client.pool.loaded:
+        client.pool.loaded[tag] = 0
+    client.limit(budget=500)
+    assert len(client.models()) == 2
+    mph.Model(third).footprint = 1000
+    assert third.footprint == 1000
+    third.solve('static')
+    assert len(client.models()) == 1
+    assert third in client.models()
+    assert fourth not in client.models()
+    assert client.pool.evicted == 4
+    client.limit()
+    with logging_disabled():
+        with raises(TypeError):
+            client.limit(count='2')       # pyright: ignore[reportArgumentType]
+        with raises(ValueError):
+            client.limit(count=0)
+        with raises(ValueError):
+            client.limit(eviction='never')  # pyright: ignore[reportArgumentType]
+    client.clear()
+    assert not client.footprints()
 
 
 def test_disconnect():
@@ -167,6 +303,7 @@ if __name__ == '__main__':
     test_init()
     test_load()
     test_create()
+    test_clone()
     test_repr()
     test_contains()
     test_iter()
@@ -175,9 +312,12 @@ if __name__ == '__main__':
     test_models()
     test_names()
     test_files()
+    test_footprints()
     test_modules()
+    test_has()
     test_caching()
     test_remove()
     test_clear()
+    test_limit()
     test_disconnect()
     test_connect()
@@ -8,6 +8,8 @@ from fixtures import temp_dir
 from fixtures import logging_disabled
 from fixtures import setup_logging
 
+from numpy         import array, asarray, zeros, load, shares_memory
+from numpy         import isnan, linspace, meshgrid
 from numpy.testing import assert_allclose
 from pytest        import raises
 from pathlib       import Path
@@ -164,6 +166,28 @@ def test_modules():
         assert value in mph.client.modules.values()
 
 
+def test_snapshot():
+    snapshot = model.snapshot()
+    assert snapshot.name == 'capacitor'
+    assert snapshot.path == ''
+    names = [child.name for child in snapshot.children]
+    assert names == [child.name() for child in model]
+    functions = snapshot.children[names.index('functions')]
+    assert 'step' in [child.name for child in functions.children]
+
+
+def test_caches():
+    caches = model.caches()
+    assert 'nodes' in caches
+    assert 'containers' in caches
+    node = model/'functions'/'step'
+    assert node.java
+    hits = model.caches()['nodes']['hits']
+    assert node.java
+    assert model.caches()['nodes']['hits'] == hits + 1
+    assert model.caches()['nodes']['size'] > 0
+
+
 def test_build():
     model.build()
     model.build('geometry')
@@ -240,6 +264,7 @@ def test_outer():
     assert values.dtype.kind  == 'f'
     assert (indices == list(range(1,4))).all()
     assert (values == (1.0, 2.0, 3.0)).all()
+    assert values.dtype.names is None
     (i, v) = model.outer(model/'datasets'/'parametric sweep')
     assert (i == indices).all()
     assert (v == values).all()
@@ -258,6 +283,24 @@ def test_outer():
         no_solution.remove()
 
 
+def test_lookup():
+    (dataset, type, solution) = model.lookup('time-dependent')
+    assert dataset == model/'datasets'/'time-dependent'
+    assert type == 'Solution'
+    assert solution == model/'solutions'/'time-dependent solution'
+    assert model.lookup(dataset) == (dataset, type, solution)
+    (default, _, _) = model.lookup(None)
+    assert default.exists()
+    assert ('default',) in model.handles.memo
+    (indices, values) = model.inner()
+    (i, v) = model.inner(default)
+    assert (i == indices).all()
+    assert (v == values).all()
+    (model/'evaluations').create('Eval').remove()
+    assert ('default',) not in model.handles.memo
+    assert model.lookup(None)[0] == default
+
+
 def test_evaluate():
     # Test global evaluation of stationary solution.
     C = model.evaluate('2*es.intWe/U^2', 'pF')
@@ -385,6 +428,447 @@ def test_evaluate():
         assert (z.imag == qy).all()
 
 
+def test_sweep():
+    (dataset, expression, unit) = ('parametric sweep', '2*ec.intWe/U^2', 'pF')
+    (indices, values, C) = model.evaluate(
+        expression, unit, dataset, 'first', 'all'
+    )
+    assert (indices == [1, 2, 3]).all()
+    assert (values == (1.0, 2.0, 3.0)).all()
+    assert C.shape == (3,)
+    assert_allclose(C[1], 0.74, atol=0.01)
+    assert_allclose(C[2], 0.53, atol=0.01)
+    (i, v, c) = model.evaluate(expression, unit, dataset, 'first', [3, 1])
+    assert (i == [3, 1]).all()
+    assert (v == (3.0, 1.0)).all()
+    assert_allclose(c, C[[2, 0]])         # pyright: ignore[reportArgumentType]
+    (i, v, t) = model.evaluate('t', 's', dataset, outer='all')
+    assert [len(times) for times in t] == [101, 201, 301]
+    (i, v, (t, d)) = model.evaluate(['t', 'd'], ['s', 'mm'], dataset, 'last',
+                                    array([1, 2]))
+    assert t.shape == d.shape == (2,)
+    assert_allclose(d, (1.0, 2.0))
+    with logging_disabled():
+        with raises(ValueError):
+            model.evaluate('t', 's', dataset, outer=[4])
+        with raises(ValueError):
+            model.evaluate('V', 'V', 'electrostatic', outer='all')
+        with raises(TypeError):
+            model.evaluate(
+                't', 's', dataset,
+                outer=[1.0],              # pyright: ignore[reportArgumentType]
+            )
+
+
+def test_evaluate_iter():
+    (dataset, expression, unit) = ('time-dependent', 'ec.normD', 'nC/m^2')
+    D = model.evaluate(expression, unit, dataset)
+    blocks = list(model.evaluate_iter(expression, unit, dataset))
+    assert len(blocks) == len(D)
+    assert_allclose(blocks[0], D[0])
+    assert_allclose(blocks[-1], D[-1])
+    blocks = list(model.evaluate_iter(expression, unit, dataset, chunk=40))
+    assert [len(block) for block in blocks] == [40, 40, 21]
+    assert_allclose(blocks[1], D[40:80])
+    D_13 = model.evaluate(expression, unit, dataset, inner=array([1, 2, 3]))
+    assert_allclose(D_13, D[:3])
+    (x, y) = model.evaluate(['x', 'y'], 'mm', dataset)
+    for (n, (x_n, y_n)) in enumerate(model.evaluate_iter(
+        ['x', 'y'], 'mm', dataset, chunk=50,
+    )):
+        assert_allclose(x_n, x[50*n:50*(n+1)])
+        assert_allclose(y_n, y[50*n:50*(n+1)])
+    C = model.evaluate('2*ec.intWe/U^2', 'pF', dataset)
+    blocks = model.evaluate_iter('2*ec.intWe/U^2', 'pF', dataset, chunk=50)
+    assert_allclose(next(blocks), C[:50])
+    with logging_disabled():
+        with raises(ValueError):
+            next(model.evaluate_iter(expression, dataset=dataset, chunk=0))
+        with raises(TypeError):
+            next(model.evaluate_iter(
+                expression, dataset=dataset,
+                chunk=1.5,                # pyright: ignore[reportArgumentType]
+            ))
+
+
+def test_out():
+    (dataset, expression, unit) = ('time-dependent', 'ec.normD', 'nC/m^2')
+    D = model.evaluate(expression, unit, dataset)
+    file = tmpdir/'results.npy'
+    results = model.evaluate(expression, unit, dataset, out=file)
+    assert file.exists()
+    assert_allclose(results, D)           # pyright: ignore[reportArgumentType]
+    assert_allclose(load(file), D)
+    del results
+    file.unlink()
+    (x, y) = model.evaluate(['x', 'y'], 'mm', dataset, inner=[1, 2])
+    out = zeros((2, 2, len(x[0])))
+    assert model.evaluate(['x', 'y'], 'mm', dataset, [1, 2], out=out) is out
+    assert_allclose(out[0], x)
+    assert_allclose(out[1], y)
+    C = model.evaluate('2*ec.intWe/U^2', 'pF', dataset, 'last')
+    out = zeros(1)
+    model.evaluate('2*ec.intWe/U^2', 'pF', dataset, 'last', out=out)
+    assert_allclose(out[0], C)
+    with logging_disabled():
+        with raises(ValueError):
+            model.evaluate(expression, unit, dataset, out=zeros(1))
+        with raises(ValueError):
+            model.evaluate(expression, unit, dataset, out=tmpdir/'out.txt')
+        with raises(TypeError):
+            model.evaluate(
+                expression, unit, dataset,
+                out=1,                    # pyright: ignore[reportArgumentType]
+            )
+        with raises(TypeError):
+            model.evaluate(
+                expression, unit, dataset, outer='all',
+                out=out,                  # pyright: ignore[reportArgumentType]
+            )
+
+
+def test_pool():
+    evaluations = model/'evaluations'
+    names = [node.name() for node in evaluations.children()]
+    C1 = model.evaluate('2*es.intWe/U^2', 'pF')
+    assert [node.name() for node in evaluations.children()] == names
+    assert model.caches()['evaluations']['size'] == 0
+    with model.batch():
+        misses = model.caches()['evaluations']['misses']
+        C2 = model.evaluate('2*es.intWe/U^2', 'F')
+        assert_allclose(C2, C1*1e-12)     # pyright: ignore[reportOperatorIssue]
+        assert len(evaluations.children()) == len(names) + 1
+        assert model.caches()['evaluations']['misses'] == misses + 1
+        hits = model.caches()['evaluations']['hits']
+        with model.batch():
+            C3 = model.evaluate('2*es.intWe/U^2', 'pF')
+            assert_allclose(C3, C1)
+        assert model.caches()['evaluations']['hits'] == hits + 1
+        assert len(evaluations.children()) == len(names) + 1
+        memo = set(model.handles.memo)
+        model.evaluate('V', 'V')
+        assert len(evaluations.children()) == len(names) + 2
+        assert memo <= set(model.handles.memo)
+        model.save(tmpdir/'pool.mph')
+        assert [node.name() for node in evaluations.children()] == names
+        assert model.caches()['evaluations']['size'] == 0
+        C4 = model.evaluate('2*es.intWe/U^2', 'pF')
+        assert_allclose(C4, C1)
+    assert [node.name() for node in evaluations.children()] == names
+    assert model.caches()['evaluations']['size'] == 0
+    (tmpdir/'pool.mph').unlink()
+
+
+def test_cache():
+    expression = '2*es.intWe/U^2'
+    model.cache_results()
+    C = model.evaluate(expression, 'pF')
+    hits = model.caches()['results']['hits']
+    cached = model.evaluate(expression, 'pF')
+    assert model.caches()['results']['hits'] == hits + 1
+    assert_allclose(cached, C)
+    cached *= 0
+    assert_allclose(model.evaluate(expression, 'pF'), C)
+    assert model.caches()['results']['bytes'] > 0
+    model.parameter('U', model.parameter('U'))
+    misses = model.caches()['results']['misses']
+    assert_allclose(model.evaluate(expression, 'pF'), C)
+    assert model.caches()['results']['misses'] == misses + 1
+    version = model.handles.version
+    domains = model/'selections'/'domains'
+    domains.select(domains.selection())
+    assert model.handles.version == version + 1
+    assert_allclose(model.evaluate(expression, 'pF'), C)
+    assert model.caches()['results']['misses'] == misses + 2
+    model.cache_results(budget=0)
+    assert model.caches()['results']['size'] == 0
+    assert model.caches()['results']['bytes'] == 0
+    # Test persistence of cached results.
+    file = tmpdir/'cached.mph'
+    cache = tmpdir/'cached.npz'
+    model.save(file)
+    loaded = client.load(file)
+    loaded.cache_results(file=cache)
+    C = loaded.evaluate(expression, 'pF')
+    loaded.cache_results(0)
+    assert cache.exists()
+    client.remove(loaded)
+    loaded = client.load(file)
+    loaded.cache_results(file=cache)
+    assert loaded.caches()['results']['size'] == 1
+    assert_allclose(loaded.evaluate(expression, 'pF'), C)
+    assert loaded.caches()['results']['hits'] == 1
+    loaded.cache_results(0)
+    client.remove(loaded)
+    file.unlink()
+    cache.unlink()
+
+
+def test_kind():
+    C = model.evaluate('2*es.intWe/U^2', 'pF')
+    assert_allclose(model.evaluate('2*es.intWe/U^2', 'pF', kind='global'), C)
+    with model.batch():
+        E = model.evaluate('es.normE', 'V/m')
+        misses = model.caches()['evaluations']['misses']
+        hits = model.caches()['evaluations']['hits']
+        assert (model.evaluate('es.normE', 'V/m') == E).all()
+        assert model.caches()['evaluations']['hits'] == hits + 1
+        assert model.caches()['evaluations']['misses'] == misses
+    assert (model.evaluate('es.normE', 'V/m', kind='field') == E).all()
+    with logging_disabled():
+        with raises(RuntimeError):
+            model.evaluate('es.normE', 'V/m', kind='global')
+        with raises(ValueError):
+            model.evaluate('es.normE', kind='invalid')  # pyright: ignore
+
+
+def test_lazy():
+    (dataset, expression, unit) = ('time-dependent', 'ec.normD', 'nC/m^2')
+    D = model.evaluate(expression, unit, dataset)
+    deferred = model.evaluate(expression, unit, dataset, lazy=True)
+    assert isinstance(deferred, mph.Deferred)
+    assert len(deferred) == len(D)
+    assert expression in repr(deferred)
+    assert_allclose(deferred[0], D[0])
+    assert_allclose(deferred[-1], D[-1])
+    assert_allclose(deferred[10:20], D[10:20])
+    assert_allclose(deferred[[1, 3]], D[[1, 3]])  # pyright: ignore[reportArgumentType]
+    assert_allclose(deferred[-1, :5], D[-1, :5])  # pyright: ignore[reportArgumentType]
+    assert_allclose(asarray(deferred), D)
+    assert not len(deferred[5:5])
+    deferred = model.evaluate(expression, unit, dataset, 'last', lazy=True)
+    assert len(deferred) == 1
+    assert_allclose(asarray(deferred), D[-1])
+    (x, y) = model.evaluate(['x', 'y'], ['mm', 'mm'], dataset, lazy=True)
+    assert_allclose(x[0], model.evaluate('x', 'mm', dataset, 'first'))
+    assert_allclose(y[0], model.evaluate('y', 'mm', dataset, 'first'))
+    C = model.evaluate('2*ec.intWe/U^2', 'pF', dataset)
+    deferred = model.evaluate('2*ec.intWe/U^2', 'pF', dataset, lazy=True)
+    assert_allclose(deferred[:3], C[:3])
+    with logging_disabled():
+        with raises(TypeError):
+            model.evaluate(
+                expression, unit, dataset, outer='all',
+                lazy=True,                # pyright: ignore[reportArgumentType]
+            )
+        with raises(ValueError):
+            model.evaluate(
+                expression, unit, dataset, out=zeros(1),
+                lazy=True,                # pyright: ignore[reportArgumentType]
+            )
+
+
+def test_coordinates():
+    coordinates = model.coordinates('electrostatic')
+    (x, y) = model.evaluate(['x', 'y'], dataset='electrostatic')
+    assert coordinates.shape == (2, len(x))
+    assert_allclose(coordinates[0], x)
+    assert_allclose(coordinates[1], y)
+    assert not coordinates.flags.writeable
+    assert model.coordinates('electrostatic') is coordinates
+    (x, E) = model.evaluate(['x', 'es.normE'], dataset='electrostatic')
+    assert shares_memory(x, coordinates)
+    assert E.shape == x.shape
+    x = model.evaluate('x', 'mm', dataset='electrostatic')
+    assert not shares_memory(x, coordinates)
+    model.property('datasets/electrostatic', 'solution',
+                   model.property('datasets/electrostatic', 'solution'))
+    assert model.coordinates('electrostatic') is not coordinates
+
+
+def test_probe():
+    coordinates = model.coordinates('electrostatic')
+    points = coordinates[:, :10].T
+    version = model.handles.version
+    probe = model.probe(points, 'electrostatic')
+    assert model.handles.version == version
+    assert ('coordinates', (model/'datasets'/'electrostatic').path, None) \
+        in model.handles.memo
+    assert len(probe) == 10
+    assert 'points=10' in repr(probe)
+    V = model.evaluate('V', 'V', 'electrostatic')
+    assert_allclose(probe.evaluate('V', 'V'), V[:10], atol=1e-6)
+    (x, y) = probe.evaluate(['x', 'y'])
+    assert_allclose(x, points[:, 0])
+    assert_allclose(y, points[:, 1])
+    probe.move(points[:5])
+    assert len(probe) == 5
+    assert_allclose(probe.evaluate('V', 'V'), V[:5], atol=1e-6)
+    (indices, values) = model.inner(probe.dataset)
+    assert len(indices) == len(values) == 1
+    probe.remove()
+    assert not probe.dataset.exists()
+    assert not any(probe.tag in node.name() for node in model/'evaluations')
+    assert model.handles.version == version
+    probe = model.probe(points, 'time-dependent')
+    assert probe.evaluate('V', 'V').shape == (10, 101)
+    probe.move(points[:1])
+    assert probe.evaluate('V', 'V', inner=[1, 2]).shape == (1, 2)
+    assert probe.evaluate('V', 'V', inner='last').shape == (1,)
+    probe.remove()
+    with logging_disabled():
+        with raises(ValueError):
+            model.probe([[0, 0, 0, 0]])
+        with raises(ValueError):
+            probe.move([[0, 0, 0]])
+
+
+def test_grid():
+    coordinates = model.coordinates('electrostatic')
+    bounds = [(coordinates[0].min(), coordinates[0].max()),
+              (coordinates[1].min(), coordinates[1].max())]
+    (x, y) = model.grid(['x', 'y'], bounds, (5, 4), dataset='electrostatic')
+    assert x.shape == y.shape == (5, 4)
+    finite = ~isnan(x)
+    assert finite.any()
+    (X, Y) = meshgrid(linspace(*bounds[0], 5), linspace(*bounds[1], 4),
+                      indexing='ij')
+    assert_allclose(x[finite], X[finite])
+    assert_allclose(y[finite], Y[finite])
+    V = model.grid('V', bounds, (5, 4), 'V', 'electrostatic')
+    assert V.shape == (5, 4)
+    W = model.grid('V', bounds, (5, 4), 'V', 'electrostatic', chunk=2)
+    assert_allclose(W, V)
+    V = model.grid('V', bounds, (5, 4), 'V', 'time-dependent', inner=[1, 2])
+    assert V.shape == (5, 4, 2)
+    W = model.grid('V', bounds, (5, 1), 'V', 'time-dependent', inner=[1, 2])
+    assert W.shape == (5, 1, 2)
+    W = model.grid('V', bounds, (5, 4), 'V', 'time-dependent', inner=[1, 2],
+                   chunk=1)
+    assert_allclose(W, V)
+    datasets = model.datasets()
+    model.grid('V', bounds, (2, 2), dataset='electrostatic')
+    assert model.datasets() == datasets
+    with logging_disabled():
+        with raises(ValueError):
+            model.grid('V', bounds, (5,))
+        with raises(ValueError):
+            model.grid('V', bounds, (5, 4), chunk=0)
+
+
+def test_reduce():
+    V = model.evaluate('V', 'V', 'electrostatic')
+    Vmax = model.reduce('V', 'maximum', unit='V', dataset='electrostatic')
+    Vmin = model.reduce('V', 'minimum', unit='V', dataset='electrostatic')
+    assert_allclose(Vmax, V.max(), rtol=1e-3)
+    assert_allclose(Vmin, V.min(), rtol=1e-3, atol=1e-6)
+    Vav = model.reduce('V', 'average', 'media', 'V', 'electrostatic')
+    assert Vmin <= Vav <= Vmax
+    (A, B) = model.reduce(['1', '2'], 'integral', 'media',
+                          dataset='electrostatic')
+    assert A > 0
+    assert_allclose(B, 2*A)
+    names = [node.name() for node in model/'evaluations']
+    with model.batch():
+        model.reduce('1', 'integral', dataset='electrostatic')
+        hits = model.caches()['evaluations']['hits']
+        A = model.reduce('1', 'integral', dataset='electrostatic')
+        assert model.caches()['evaluations']['hits'] == hits + 1
+    assert A > 0                          # pyright: ignore[reportOperatorIssue]
+    assert [node.name() for node in model/'evaluations'] == names
+    Emax = model.reduce('es.normE', 'maximum', 'axis', dataset='electrostatic')
+    assert Emax > 0                       # pyright: ignore[reportOperatorIssue]
+    Vmax = model.reduce('V', 'maximum', dataset='time-dependent')
+    assert Vmax.shape == (101,)
+    Vlast = model.reduce('V', 'maximum', dataset='time-dependent',
+                         inner='last')
+    assert_allclose(Vlast, Vmax[-1])
+    with logging_disabled():
+        with raises(ValueError):
+            model.reduce('V', 'median')   # pyright: ignore[reportArgumentType]
+        with raises(ValueError):
+            model.reduce('V', 'maximum', 'non-existing')
+        with raises(ValueError):
+            model.reduce('V', 'maximum', 'center')
+        with raises(TypeError):
+            model.reduce(
+                'V', 'maximum',
+                selection=1,              # pyright: ignore[reportArgumentType]
+            )
+
+
+def test_follow():
+    (dataset, expression, unit) = ('time-dependent', '2*ec.intWe/U^2', 'pF')
+    C = model.evaluate(expression, unit, dataset)
+    follower = model.follow(expression, dataset, unit)
+    (indices, values, results) = follower.poll()
+    assert (indices == list(range(1, 102))).all()
+    assert values[-1] == 1
+    assert_allclose(results, C)
+    assert follower.last == 101
+    (indices, values, results) = follower.poll()
+    assert not len(indices)
+    assert not len(values)
+    assert not len(results)
+    follower.last = 100
+    (indices, values, results) = follower.poll()
+    assert (indices == [101]).all()
+    assert results.shape == (1,)
+    assert_allclose(results, C[-1:])
+    follower.last = 50
+    (indices, values, results) = follower.poll()
+    assert len(indices) == len(results) == 51
+    follower.reset()
+    assert len(follower.poll()[0]) == 101
+    follower.last = 1000
+    assert len(follower.poll()[0]) == 101
+    follower = model.follow(['x', 'y'], dataset)
+    (indices, values, (x, y)) = follower.poll()
+    assert x.shape == y.shape
+    assert len(x) == 101
+    assert 'last=101' in repr(follower)
+
+
+def test_selection():
+    dataset = 'electrostatic'
+    x = model.evaluate('x', dataset=dataset)
+    xm = model.evaluate('x', dataset=dataset, selection='media')
+    assert 0 < len(xm) < len(x)
+    assert_allclose(model.evaluate('x', dataset=dataset,
+                                   selection=model/'selections'/'media'), xm)
+    xd = model.evaluate('x', dataset=dataset, selection='domains')
+    assert len(xd) == len(x)
+    xr = model.evaluate('x', dataset=dataset, refine=3)
+    assert len(xr) > len(x)
+    V = model.evaluate('V', 'V', dataset, smooth='none')
+    assert V.shape == x.shape
+    (Vx, Vy) = model.evaluate(['V', 'y'], dataset=dataset, selection='media')
+    assert Vx.shape == Vy.shape == xm.shape
+    deferred = model.evaluate('x', dataset='time-dependent', inner='last',
+                              selection='media', lazy=True)
+    assert deferred.options['selection'].name() == 'media'
+    x1 = model.evaluate('x', dataset=dataset, selection=1)
+    assert 0 < len(x1) < len(x)
+    assert_allclose(model.evaluate('x', dataset=dataset, selection=[1]), x1)
+    model.cache_results()
+    domains = model/'selections'/'domains'
+    xd = model.evaluate('x', dataset=dataset, selection=domains)
+    assert len(xd) == len(x)
+    domains.select([1])
+    xd = model.evaluate('x', dataset=dataset, selection=domains)
+    assert len(xd) < len(x)
+    domains.select('all')
+    model.cache_results(budget=0)
+    with logging_disabled():
+        with raises(ValueError):
+            model.evaluate('U', dataset=dataset, kind='global', refine=2)
+        probe = model.probe([[0, 0]], dataset)
+        with raises(ValueError):
+            model.evaluate('V', dataset=probe.dataset, selection=1)
+        probe.remove()
+        with raises(ValueError):
+            model.evaluate('x', dataset=dataset, selection='non-existing')
+        with raises(TypeError):
+            model.evaluate(
+                'x', dataset=dataset,
+                selection=1.5,            # pyright: ignore[reportArgumentType]
+            )
+        with raises(ValueError):
+            model.evaluate('x', dataset=dataset, refine=0)
+        with raises(ValueError):
+            model.evaluate('x', dataset=dataset, smooth='sometimes')
+
+
 def test_rename():
     name = model.name()
     model.rename('test')
@@ -467,6 +951,19 @@ def test_remove():
     assert 'Image 1' not in model.functions()
 
 
+def test_refresh():
+    node = model/'functions'/'step'
+    assert node.exists()
+    node.java.label('renamed')
+    model.refresh(node)
+    assert not node.exists()
+    assert (model/'functions'/'renamed').exists()
+    (model/'functions'/'renamed').java.label('step')
+    model.refresh()
+    assert node.exists()
+    assert model.caches()['nodes']['size'] > 0
+
+
 def test_import():
     # Create interpolation function based on external image.
     image = model.create('functions/image', 'Image')
@@ -722,6 +1219,8 @@ if __name__ == '__main__':
         test_plots()
         test_exports()
         test_modules()
+        test_snapshot()
+        test_caches()
 
         test_build()
         test_mesh()
@@ -729,7 +1228,21 @@ if __name__ == '__main__':
 
         test_inner()
         test_outer()
+        test_lookup()
         test_evaluate()
+        test_sweep()
+        test_evaluate_iter()
+        test_out()
+        test_pool()
+        test_cache()
+        test_kind()
+        test_lazy()
+        test_coordinates()
+        test_probe()
+        test_grid()
+        test_reduce()
+        test_follow()
+        test_selection()
 
         test_rename()
         test_parameter()
@@ -740,6 +1253,7 @@ if __name__ == '__main__':
         test_properties()
         test_create()
         test_remove()
+        test_refresh()
 
         test_import()
         test_export()
@@ -13,6 +13,7 @@ from pathlib       import Path
 from numpy         import array
 from numpy.testing import assert_allclose
 from textwrap      import dedent
+import json
 
 
 client: Client
@@ -221,6 +222,30 @@ def test_problems():
     solver.parent().java.clearSolutionData()
 
 
+def test_snapshot():
+    snapshot = Node(model, 'functions').snapshot()
+    assert snapshot.name == 'functions'
+    assert snapshot.path == 'functions'
+    assert snapshot.properties is None
+    step = next(child for child in snapshot.children if child.name == 'step')
+    assert step.path == 'functions/step'
+    assert step.tag == 'step1'
+    assert step.type == 'Step'
+    assert step.active
+    snapshot = Node(model, 'functions/step').snapshot(properties=True)
+    assert snapshot.properties['funcname'] == 'step'  # pyright: ignore[reportOptionalSubscript]
+    data = snapshot.as_dict()
+    assert data['properties']['funcname'] == 'step'
+    assert json.loads(json.dumps(data)) == data
+    snapshot = Node(model, '').snapshot(max_depth=1)
+    assert len(snapshot.children) == len(Node.groups)
+    assert all(not child.children for child in snapshot.children)
+    snapshot = Node(model, 'datasets').snapshot()
+    assert 'sweep//solution' in [child.name for child in snapshot.children]
+    with logging_disabled(), raises(LookupError):
+        Node(model, 'functions/non-existing').snapshot()
+
+
 def test_rename():
     with logging_disabled():
         with raises(PermissionError):
@@ -511,6 +536,27 @@ def test_unescape():
     assert node.unescape('a//b//c') == 'a/b/c'
 
 
+def test_handles():
+    handles = model.handles
+    functions = Node(model, 'functions')
+    step = functions/'step'
+    assert step.java
+    assert step.path in handles.handles
+    index = handles.index(functions.path, functions.java)
+    assert index['step'] == 'step1'
+    assert 'step' in handles.names(functions.path, functions.java)
+    reused = handles.statistics()['containers']['hits']
+    handles.index(functions.path, functions.java)
+    assert handles.statistics()['containers']['hits'] == reused + 1
+    handles.invalidate(step.path)
+    assert step.path not in handles.handles
+    assert functions.path not in handles.indices
+    assert step.exists()
+    handles.invalidate()
+    assert not handles.handles
+    assert not handles.indices
+
+
 def test_load_patterns():
     tags = node.load_patterns()
     assert 'physics → Electrostatics' in tags
@@ -535,7 +581,23 @@ def test_cast():
     bool_array_2d = array([[True, False], [False, True]])
     assert node.cast(bool_array_1d).__class__.__name__ == 'boolean[]'
     assert node.cast(bool_array_2d).__class__.__name__ == 'boolean[][]'
+    assert node.cast([1.0, 2.0]).__class__.__name__ == 'double[]'
+    assert node.cast([1, 2]).__class__.__name__ == 'int[]'
+    assert node.cast([[1, 2.5], [3, 4]]).__class__.__name__ == 'double[][]'
+    assert node.cast([[1.0], [2.0, 3.0]]).__class__.__name__ == 'double[][]'
+    assert node.cast(['a', 'b']).__class__.__name__ == 'java.lang.String[]'
+    assert node.cast([]).__class__.__name__ == 'java.lang.String[]'
+    table = array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    strided = node.cast(table[:, ::2])
+    assert strided.__class__.__name__ == 'double[][]'
+    assert list(strided[1]) == [4.0, 6.0]  # pyright: ignore[reportOptionalSubscript]
+    rows = array([array([1.0, 2.0]), array([3.0])], dtype=object)
+    assert node.cast(rows).__class__.__name__ == 'double[][]'
+    integers = array([1, 2], dtype='int64')
+    assert node.cast(integers).__class__.__name__ == 'int[]'
     with logging_disabled():
+        with raises(OverflowError):
+            node.cast(array([2**40]))
         with raises(TypeError):
             array3d = array([[[1,2], [3,4]], [[5,6], [7,8]]], dtype=object)
             node.cast(array3d)
@@ -548,6 +610,22 @@ def test_cast():
             node.cast({1, 2, 3})          # pyright: ignore[reportArgumentType]
 
 
+def test_convert():
+    values = node.convert(node.cast(array([1.0, 2.0, 3.0])))
+    assert values.dtype == 'float64'
+    assert (values == [1.0, 2.0, 3.0]).all()
+    matrix = node.convert(node.cast(array([[1, 2], [3, 4]], dtype='int32')))
+    assert matrix.dtype == 'int32'
+    assert matrix.shape == (2, 2)
+    flags = node.convert(node.cast(array([[True, False], [False, True]])))
+    assert flags.dtype == 'bool'
+    ragged = node.convert(node.cast([[1.0, 2.0], [3.0]]))
+    assert ragged.dtype.kind == 'O'
+    assert ragged.shape == (2,)
+    assert (ragged[0] == [1.0, 2.0]).all()
+    assert (ragged[1] == [3.0]).all()
+
+
 def test_get():
     pass
 
@@ -590,6 +668,13 @@ def test_tree():
            └─ Basic
     """
     assert output.text().strip() == dedent(expected).strip()
+    snapshot = (model/'materials').snapshot()
+    with capture_stdout() as output:
+        mph.tree(snapshot)
+    assert output.text().strip() == dedent(expected).strip()
+    with capture_stdout() as output:
+        mph.tree(model/'non-existing')
+    assert output.text().strip() == 'non-existing'
 
 
 def test_inspect():
@@ -623,6 +708,7 @@ if __name__ == '__main__':
 
     test_comment()
     test_problems()
+    test_snapshot()
 
     test_rename()
     test_property()
@@ -639,12 +725,14 @@ if __name__ == '__main__':
     test_join()
     test_escape()
     test_unescape()
+    test_handles()
 
     test_load_patterns()
     test_feature_path()
     test_tag_pattern()
 
     test_cast()
+    test_convert()
     test_get()
     test_tree()
     test_inspect()
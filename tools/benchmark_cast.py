@@ -0,0 +1,74 @@
+﻿"""
+Measures how fast numeric data is cast to Java arrays.
+
+Compares `mph.node.cast()`, which converts homogeneous numeric lists as well
+as NumPy arrays to Java arrays in bulk, with the item-by-item conversion it
+performed previously. The data is a two-column table, like one would assign
+to an interpolation function or a polygon's coordinate list.
+
+This only needs a Java VM, not a Comsol installation. JPype looks for the
+default JVM, which it usually finds via the `JAVA_HOME` environment variable.
+"""
+
+from mph.node import cast
+
+import jpype
+from jpype import JBoolean, JInt, JDouble, JString, JArray
+
+from numpy   import random, ndarray
+from timeit  import repeat
+
+
+def cast_itemwise(value):
+    """Casts values to Java data types item by item, as done previously."""
+    if isinstance(value, bool):
+        return JBoolean(value)
+    elif isinstance(value, int):
+        return JInt(value)
+    elif isinstance(value, float):
+        return JDouble(value)
+    elif isinstance(value, str):
+        return JString(value)
+    elif isinstance(value, (list, tuple)):
+        dimension = 0
+        item = value
+        while isinstance(item, (list, tuple)):
+            dimension += 1
+            if not len(item):
+                datatype = JString
+                value = []
+                break
+            item = item[0]
+        else:
+            datatype = cast_itemwise(item).__class__
+        value = [cast_itemwise(item) for item in value]
+        return JArray(datatype, dimension)(value)
+    elif isinstance(value, ndarray):
+        return JArray(JDouble, value.ndim)(value)
+    raise TypeError(f'Cannot cast values of type "{type(value).__name__}".')
+
+
+def best_of(function, value, repetitions: int = 3) -> float:
+    """Returns the shortest run time of the function applied to value."""
+    return min(repeat(lambda: function(value), number=1, repeat=repetitions))
+
+
+jpype.startJVM()
+
+print(f'{"rows":>8}  {"input":<18}  {"item-wise":>10}  {"bulk":>10}  '
+      f'{"speed-up":>8}')
+for rows in (1_000, 10_000, 100_000):
+    table = random.default_rng(0).random((rows, 2))
+    inputs = {
+        'list of lists':    table.tolist(),
+        'array':            table,
+        'array, strided':   table[:, ::-1],
+    }
+    for (label, value) in inputs.items():
+        before = best_of(cast_itemwise, value)
+        after  = best_of(cast, value)
+        assert len(cast(value)) == rows
+        print(f'{rows:>8}  {label:<18}  {before:>9.3f}s  {after:>9.4f}s  '
+              f'{before/after:>7.0f}x')
+
+jpype.shutdownJVM()
@@ -0,0 +1,43 @@
+﻿"""
+Measures how fast models are cloned compared to loading them from disk.
+
+Loads the demo capacitor model a number of times via `Client.load()`, with
+caching disabled, and then clones it as many times via `Client.clone()`.
+Cloning reloads the model from a local copy of the file, so the difference
+is largest when the template is stored on a slow network drive. Pass the
+path of such a file as the command-line argument to measure that case.
+
+This needs a Comsol installation.
+"""
+
+import mph
+
+from pathlib import Path
+from time    import perf_counter
+from sys     import argv
+
+
+root = Path(__file__).resolve().parent.parent
+file = Path(argv[1]) if len(argv) > 1 else root/'demos'/'capacitor.mph'
+repetitions = 5
+
+
+client = mph.start(cores=1)
+client.caching(False)
+template = client.load(file)
+
+print(f'{"method":<8}  {"best":>8}  {"mean":>8}')
+for method in ('load', 'clone'):
+    times = []
+    for _ in range(repetitions):
+        start = perf_counter()
+        if method == 'load':
+            model = client.load(file)
+        else:
+            model = client.clone(template)
+        times.append(perf_counter() - start)
+        client.remove(model)
+    print(f'{method:<8}  {min(times):>7.3f}s  '
+          f'{sum(times)/len(times):>7.3f}s')
+
+client.clear()